@@ -130,6 +130,8 @@ pip3 install Flask==2.3.3
 pip3 install RPi.GPIO==0.7.1
 pip3 install spidev==3.6
 pip3 install requests==2.31.0
+pip3 install waitress==2.1.2
+pip3 install orjson==3.9.10
 pip3 install Werkzeug==2.3.7
 pip3 install Jinja2==3.1.2
 pip3 install MarkupSafe==2.1.3
@@ -166,6 +168,11 @@ spi_mode = 1
 spi_max_hz = 2000000
 lco_display_enabled = false
 irq_active_high = false
+realtime_cpu = -1
+realtime_priority = 0
+init_max_retries = 8
+init_retry_delay = 5
+init_backoff_base = 1.3
 
 [ALERTS]
 energy_threshold = 150000
@@ -21,23 +21,33 @@ Version: 2.1-Production-Enhanced-gpiozero-Imperial-FIXED
 """
 
 import configparser
+import functools
+import heapq
+import io
+import itertools
 import os
+import random
 import threading
 import time
 import json
 import logging
 import atexit
-from logging.handlers import RotatingFileHandler
-from datetime import datetime, timedelta
+from array import array
+from logging.handlers import RotatingFileHandler, QueueHandler, QueueListener
+from datetime import datetime
 from collections import deque
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass
 from enum import Enum
-from queue import Queue, Empty
+from queue import SimpleQueue
 
 import requests
+from urllib3.util.retry import Retry
 import spidev
 from gpiozero import Device, Button
 from gpiozero.pins.pigpio import PiGPIOFactory
-from flask import Flask, render_template, request, jsonify, redirect, url_for, flash, Response
+from flask import Flask, render_template, request, jsonify, redirect, url_for, flash, Response, stream_with_context
+from flask.json.provider import DefaultJSONProvider
 from werkzeug.serving import WSGIRequestHandler
 
 # Try to use pigpio for better performance, fall back to default if not available
@@ -48,6 +58,25 @@ except Exception:
     # Use default pin factory (RPi.GPIO-based)
     GPIO_BACKEND = "default"
 
+# Status message for an active sensor, built once
+STATUS_MONITORING = f"Monitoring (Event-Driven, {GPIO_BACKEND})"
+
+# Prefer the waitress production WSGI server, fall back to Werkzeug if not installed
+try:
+    from waitress import serve as waitress_serve
+    WSGI_SERVER = "waitress"
+except ImportError:
+    waitress_serve = None
+    WSGI_SERVER = "werkzeug"
+
+# Prefer orjson for JSON encoding, fall back to the standard library if not installed
+try:
+    import orjson
+    JSON_BACKEND = "orjson"
+except ImportError:
+    orjson = None
+    JSON_BACKEND = "json"
+
 # --- Constants and Enumerations ---
 class AlertLevel(Enum):
     """Enumeration for different alert severity levels"""
@@ -64,10 +93,14 @@ def miles_to_km(miles):
     """Convert miles to kilometers"""
     return miles / 0.621371
 
+@functools.lru_cache(maxsize=256)
 def format_distance(km_value, use_imperial=True, include_unit=True):
     """
     Format distance value with appropriate unit
 
+    Results are memoized: the sensor only reports whole kilometres (1-63),
+    so the same few strings are requested over and over.
+
     Args:
         km_value: Distance in kilometers
         use_imperial: If True, convert to miles; if False, keep as km
@@ -77,54 +110,380 @@ def format_distance(km_value, use_imperial=True, include_unit=True):
         Formatted string with distance and unit
     """
     if use_imperial:
-        value = km_to_miles(km_value)
-        unit = "mi" if include_unit else ""
-        return f"{value:.1f}{' ' + unit if unit else ''}"
-    else:
-        unit = "km" if include_unit else ""
-        return f"{km_value}{' ' + unit if unit else ''}"
+        text = f"{km_value * 0.621371:.1f}"
+        return f"{text} mi" if include_unit else text
+    return f"{km_value} km" if include_unit else f"{km_value}"
 
 def get_distance_unit():
     """Get the configured distance unit (imperial or metric)"""
-    return get_config_boolean('DISPLAY', 'use_imperial_units', True)
+    return RUNTIME_CFG.use_imperial
 
 # --- Rate Limiting Filter for Logging ---
 class RateLimitFilter(logging.Filter):
-    """Rate limit repetitive log messages to prevent log spam"""
-    def __init__(self, rate=10):
+    """
+    Rate limit repetitive log messages to prevent log spam
+
+    Records are bucketed by logger name, unformatted message and arguments,
+    so the filter never has to build the final message text yet treats
+    "%s"-style messages with different values as different messages.
+    Stale buckets are swept every `sweep_interval` records to keep memory
+    bounded.
+    """
+    def __init__(self, rate=10, window=60, sweep_interval=1000):
         super().__init__()
         self.rate = rate
-        self.messages = {}
+        self.window = window
+        self.sweep_interval = sweep_interval
+        self.messages = {}  # (name, msg, args) -> (window_start, count)
+        self.calls = 0
 
     def filter(self, record):
-        current_time = time.time()
-        msg = record.getMessage()
-
-        if msg in self.messages:
-            last_time, count = self.messages[msg]
-            if current_time - last_time < 60:  # Within 1 minute
-                if count >= self.rate:
-                    return False  # Suppress
-                self.messages[msg] = (last_time, count + 1)
-            else:
-                self.messages[msg] = (current_time, 1)
+        current_time = time.monotonic()
+        key = (record.name, record.msg, record.args)
+        try:
+            hash(key)
+        except TypeError:  # Unhashable args (e.g. a dict): bucket by message only
+            key = (record.name, record.msg)
+
+        self.calls += 1
+        if self.calls >= self.sweep_interval:
+            self.calls = 0
+            self._sweep(current_time)
+
+        entry = self.messages.get(key)
+        if entry is not None and current_time - entry[0] < self.window:
+            window_start, count = entry
+            if count >= self.rate:
+                return False  # Suppress
+            self.messages[key] = (window_start, count + 1)
         else:
-            self.messages[msg] = (current_time, 1)
+            self.messages[key] = (current_time, 1)
 
         return True
 
+    def _sweep(self, current_time):
+        """Drop buckets whose rate window has expired"""
+        expired = [k for k, (start, _) in self.messages.items() if current_time - start >= self.window]
+        for k in expired:
+            self.messages.pop(k, None)
+
+class BufferedRotatingFileHandler(RotatingFileHandler):
+    """
+    RotatingFileHandler that does not flush after every record
+
+    Records accumulate in the file's write buffer and are written out by
+    flush_buffer(), which BatchFlushQueueListener calls once its queue is
+    drained, so a burst of log lines costs one write instead of one each.
+    Rollover and close still flush as usual.
+
+    The base class checks the size limit with stream.seek()/tell(), which
+    flushes the text stream on every record; the file size is tracked here
+    instead so the buffer survives until flush_buffer().
+    """
+    def _open(self):
+        stream = super()._open()
+        # Nothing is buffered yet, so the on-disk size is the stream size
+        self._size = os.fstat(stream.fileno()).st_size
+        return stream
+
+    def shouldRollover(self, record):
+        """Same test as RotatingFileHandler (characters, like the base), without seeking"""
+        # See bpo-45401: never roll over anything other than regular files
+        if os.path.exists(self.baseFilename) and not os.path.isfile(self.baseFilename):
+            return False
+        if self.stream is None:  # delay was set
+            self.stream = self._open()
+        if self.maxBytes > 0:
+            self._record_size = len(self.format(record)) + len(self.terminator)
+            return self._size + self._record_size >= self.maxBytes
+        return False
+
+    def emit(self, record):
+        # Rollover (if any) reopens the stream and resets _size before the write
+        self._record_size = 0
+        super().emit(record)
+        self._size += self._record_size
+
+    def flush(self):
+        pass  # Deferred to flush_buffer()
+
+    def flush_buffer(self):
+        """Write any buffered records to disk"""
+        super().flush()
+
+class BatchFlushQueueListener(QueueListener):
+    """QueueListener that flushes buffering handlers whenever its queue runs empty"""
+    def handle(self, record):
+        super().handle(record)
+        if self.queue.empty():
+            for handler in self.handlers:
+                flush_buffer = getattr(handler, 'flush_buffer', None)
+                if flush_buffer:
+                    flush_buffer()
+
+# --- Single-Thread Timer Scheduler ---
+class ScheduledTask:
+    """Handle for a callback queued on an AlertScheduler"""
+    __slots__ = ('deadline', 'callback', 'args', 'cancelled', 'done', 'scheduler')
+
+    def __init__(self, deadline, callback, args, scheduler):
+        self.deadline = deadline      # time.monotonic() value to run at
+        self.callback = callback
+        self.args = args
+        self.cancelled = False
+        self.done = False
+        self.scheduler = scheduler
+
+    def cancel(self):
+        """Cancel the task (lazily dropped by the scheduler thread)"""
+        self.scheduler._cancel(self)
+
+    def is_alive(self):
+        """True while the task is still pending (threading.Timer compatible)"""
+        return not (self.cancelled or self.done)
+
+class AlertScheduler:
+    """
+    Run delayed callbacks from one long-lived daemon thread
+
+    A heap of (deadline, sequence, task) entries is serviced by a single
+    worker waiting on a Condition, so scheduling a callback never spawns an
+    OS thread and cancelling one is just a flag flip.
+
+    Cancelled entries stay in the heap until they reach the top. Every
+    strike reschedules the all-clear timer, so during a storm they are
+    purged whenever the heap doubles in size (amortized O(1) per schedule).
+    """
+    MIN_COMPACT_SIZE = 64
+
+    def __init__(self):
+        self._heap = []
+        self._sequence = itertools.count()  # Tie-breaker so tasks never compare
+        self._cond = threading.Condition()
+        self._thread = None
+        self._compact_at = self.MIN_COMPACT_SIZE
+        self._pending = 0  # Tasks neither run nor cancelled
+
+    def schedule(self, delay, callback, *args):
+        """
+        Schedule callback(*args) to run after delay seconds
+
+        Returns:
+            ScheduledTask handle supporting cancel() and is_alive()
+        """
+        task = ScheduledTask(time.monotonic() + delay, callback, args, self)
+        with self._cond:
+            if len(self._heap) >= self._compact_at:
+                self._compact()
+            heapq.heappush(self._heap, (task.deadline, next(self._sequence), task))
+            self._pending += 1
+            if self._thread is None or not self._thread.is_alive():
+                self._thread = threading.Thread(target=self._run, daemon=True)
+                self._thread.start()
+            self._cond.notify()
+        return task
+
+    def _compact(self):
+        """Drop cancelled entries from the heap (caller holds the condition)"""
+        self._heap = [entry for entry in self._heap if not entry[2].cancelled]
+        heapq.heapify(self._heap)
+        self._compact_at = max(self.MIN_COMPACT_SIZE, 2 * len(self._heap))
+
+    def _cancel(self, task):
+        """Mark one task cancelled, keeping the pending count in step"""
+        with self._cond:
+            if not (task.cancelled or task.done):
+                task.cancelled = True
+                self._pending -= 1
+
+    def pending(self):
+        """Number of scheduled tasks that have not run or been cancelled"""
+        return self._pending
+
+    def cancel_all(self):
+        """Cancel every pending task"""
+        with self._cond:
+            for _, _, task in self._heap:
+                task.cancelled = True
+            self._heap.clear()
+            self._pending = 0
+
+    def _run(self):
+        """Worker loop: sleep until the earliest deadline, then run that task"""
+        while True:
+            with self._cond:
+                while True:
+                    if not self._heap:
+                        self._cond.wait()
+                        continue
+                    deadline, _, task = self._heap[0]
+                    if task.cancelled:
+                        heapq.heappop(self._heap)
+                        continue
+                    timeout = deadline - time.monotonic()
+                    if timeout <= 0:
+                        heapq.heappop(self._heap)
+                        task.done = True
+                        self._pending -= 1
+                        break
+                    self._cond.wait(timeout)
+
+            # Run outside the condition so callbacks may schedule new tasks
+            try:
+                task.callback(*task.args)
+            except Exception as e:
+                app.logger.error(f"Scheduled callback error: {e}", exc_info=True)
+
+# --- Fixed-Size Event Ring ---
+class EventRing:
+    """
+    Fixed-capacity ring buffer of lightning events stored as parallel arrays
+
+    Events are kept as native scalars (epoch timestamp, distance, energy,
+    alert flags) rather than one dict per strike; dicts are only built for
+    the events a caller actually renders.
+
+    Publishing is lock-free for a single writer (the monitoring thread):
+    `seq` is odd while a push is in progress and even once it is complete,
+    and copy() retries until it sees the same even value before and after.
+    """
+    __slots__ = ('ts', 'dist', 'energy', 'sent', 'level', 'head', 'size', 'cap', 'seq')
+
+    LEVEL_CODES = {None: 0, AlertLevel.WARNING: 1, AlertLevel.CRITICAL: 2}
+    LEVEL_NAMES = (None, AlertLevel.WARNING.value, AlertLevel.CRITICAL.value)
+
+    def __init__(self, capacity=100):
+        self.cap = capacity
+        self.ts = array('d', [0.0] * capacity)   # Epoch seconds
+        self.dist = array('B', [0] * capacity)   # Distance in km (1-63)
+        self.energy = array('L', [0] * capacity) # 20-bit energy value
+        self.sent = bytearray(capacity)          # 1 if an alert was sent
+        self.level = bytearray(capacity)         # Index into LEVEL_NAMES
+        self.head = 0                            # Next slot to write
+        self.size = 0
+        self.seq = 0                             # Odd while a push is in progress
+
+    def __len__(self):
+        return self.size
+
+    def push(self, timestamp, distance_km, energy, alert_sent, alert_level):
+        """Store one event, overwriting the oldest once the ring is full (single writer only)"""
+        self.seq += 1  # Odd: write in progress
+        i = self.head
+        self.ts[i] = timestamp
+        self.dist[i] = distance_km
+        self.energy[i] = energy
+        self.sent[i] = 1 if alert_sent else 0
+        self.level[i] = self.LEVEL_CODES.get(alert_level, 0)
+        self.head = (i + 1) % self.cap
+        if self.size < self.cap:
+            self.size += 1
+        self.seq += 1  # Even: write published
+
+    def copy(self):
+        """
+        Return a consistent, independent copy of the ring without locking
+
+        Plain array memcpy; retried if a push overlapped the copy.
+        """
+        while True:
+            seq = self.seq
+            if seq & 1:
+                time.sleep(0)  # Writer mid-push: yield and retry
+                continue
+            other = EventRing.__new__(EventRing)
+            other.cap = self.cap
+            other.ts = array('d', self.ts)
+            other.dist = array('B', self.dist)
+            other.energy = array('L', self.energy)
+            other.sent = bytearray(self.sent)
+            other.level = bytearray(self.level)
+            other.head = self.head
+            other.size = self.size
+            other.seq = seq
+            if self.seq == seq:
+                return other
+
+    def snapshot(self, limit=None):
+        """
+        Materialize stored events as dicts, oldest first
+
+        Args:
+            limit: Only return the newest `limit` events (default: all)
+
+        Returns:
+            List of event dicts
+        """
+        count = self.size if limit is None else min(limit, self.size)
+        start = (self.head - count) % self.cap
+        events = []
+        for k in range(count):
+            i = (start + k) % self.cap
+            events.append({
+                'timestamp': self.ts[i],
+                'distance_km': self.dist[i],
+                'energy': self.energy[i],
+                'alert_sent': bool(self.sent[i]),
+                'alert_level': self.LEVEL_NAMES[self.level[i]]
+            })
+        return events
+
 # --- Global Configuration and State Management ---
 # ConfigParser instance for reading configuration from config.ini
-CONFIG = configparser.ConfigParser()
+# (interpolation disabled: values are plain scalars, so every get() skips
+# the %-interpolation pass)
+CONFIG = configparser.ConfigParser(interpolation=None)
+
+@dataclass(frozen=True)
+class RuntimeConfig:
+    """
+    Pre-parsed snapshot of the settings read on the strike/alert hot path
+
+    Built once from CONFIG and swapped as a whole when the configuration
+    changes, so readers never see a half-updated set of values.
+    """
+    energy_threshold: int = 100000
+    critical_distance: int = 10
+    warning_distance: int = 30
+    all_clear_timer: int = 15
+    slack_enabled: bool = False
+    slack_configured: bool = False  # A bot token is set
+    use_imperial: bool = True
+    noise_handling: bool = False
+    noise_event_threshold: int = 15
+    noise_window_seconds: int = 120
+    noise_revert_seconds: int = 600
+    raised_noise_floor_level: int = 5
+    config_valid: bool = True
+
+@dataclass(frozen=True)
+class SensorConfig:
+    """
+    Typed [SENSOR] settings, parsed once per sensor initialization
+
+    Handed to AS3935LightningDetector so the driver never touches CONFIG.
+    """
+    spi_bus: int = 0
+    spi_device: int = 0
+    irq_pin: int = 2
+    spi_mode: int = 1
+    spi_max_hz: int = 2000000
+    active_high: bool = True
+    indoor: bool = True
+    sensitivity: str = 'high'
+
+# Current runtime snapshot - replaced (never mutated) by refresh_runtime_config()
+RUNTIME_CFG = RuntimeConfig()
+RUNTIME_CFG_LOCK = threading.Lock()  # Serializes snapshot rebuilds
 
 # Main monitoring state - thread-safe dictionary holding all shared state
 # This dictionary is protected by the 'lock' member for thread safety
 MONITORING_STATE = {
     "lock": threading.Lock(),              # Protects all state modifications
     "stop_event": threading.Event(),       # Signals threads to stop
-    "events": deque(maxlen=100),           # Circular buffer of lightning events
-    "status": {                            # Current system status
-        'last_reading': None,              # ISO timestamp of last sensor reading
+    "irq_event": threading.Event(),        # Set by the IRQ edge callback
+    "events": EventRing(100),              # Circular buffer of lightning events (lock-free)
+    "status": {                            # Current system status (copy-on-write, see update_status)
         'sensor_active': False,            # Is monitoring thread running?
         'status_message': 'Not started',   # Human-readable status
         'indoor_mode': False,              # Indoor/outdoor mode from config
@@ -134,33 +493,101 @@ MONITORING_STATE = {
         'use_imperial': True               # Use imperial units (miles)
     },
     "thread": None,                        # Reference to monitoring thread
-    "noise_events": deque(maxlen=50),      # Buffer for counting disturber events
-    "noise_revert_timer": None,            # Timer to revert noise floor changes
+    "noise_events": deque(maxlen=15),      # Monotonic timestamps of recent disturber events (maxlen = event_threshold)
+    "noise_revert_timer": None,            # ScheduledTask to revert noise floor changes
     "watchdog_thread": None,               # Thread monitoring the monitoring thread
-    "last_interrupt_time": 0,              # For interrupt storm detection
-    "interrupt_count": 0,                  # Count interrupts for storm detection
-    "interrupt_storm_detected": False      # Flag for interrupt storm condition
+    "interrupt_storm_detected": False      # Flag for interrupt storm condition (set by watchdog)
 }
 
+# IRQ edge statistics, written only by the GPIO callback thread and read
+# lock-free elsewhere: [total edge count, monotonic_ns of last edge]
+IRQ_STATS = array('Q', [0, 0])
+IRQ_STORM_PER_MINUTE = 600  # Edges per watchdog interval that count as a storm
+IRQ_SETTLE_NS = 2_000_000   # INT register is valid 2 ms after the IRQ edge
+
+# Epoch timestamp of the last handled interrupt (0.0 = never). Written on
+# every interrupt by the monitoring thread only, so it lives outside the
+# copy-on-write status dict; readers merge it in with status_view().
+LAST_READING = array('d', [0.0])
+
+# Last sensor health check result as (monotonic time, healthy). Rebound as a
+# whole tuple so readers never see a half-updated pair.
+HEALTH_CACHE = (0.0, False)
+HEALTH_TTL = 2.0  # Seconds a health check result (or /health response) is reused
+
+# Last successful /check_sensor response as (monotonic time, JSON body).
+# Dropped whenever a register is written or an interrupt is handled.
+CHECK_SENSOR_RESPONSE = (float('-inf'), b'')
+CHECK_SENSOR_TTL = 2.0  # Seconds a /check_sensor response is reused
+
+def invalidate_check_sensor():
+    """Drop the cached /check_sensor response (sensor registers changed)"""
+    global CHECK_SENSOR_RESPONSE
+    CHECK_SENSOR_RESPONSE = (float('-inf'), b'')
+
+def update_status(**changes):
+    """
+    Publish a new status snapshot with the given fields changed
+
+    MONITORING_STATE['status'] is copy-on-write: writers build a new dict and
+    rebind the reference, so readers can take `MONITORING_STATE['status']`
+    without the lock. Snapshots must never be modified in place.
+    """
+    with MONITORING_STATE['lock']:
+        _replace_status(**changes)
+
+def status_view():
+    """Current status snapshot plus the lock-free last_reading, for display/API"""
+    return {**MONITORING_STATE['status'], 'last_reading': LAST_READING[0] or None}
+
+def _replace_status(**changes):
+    """Copy-on-write status update for callers already holding MONITORING_STATE['lock']"""
+    MONITORING_STATE['status'] = {**MONITORING_STATE['status'], **changes}
+
 # Alert state management - separate from monitoring state for clarity
 ALERT_STATE = {
     "warning_timer": None,                 # Timer for warning zone all-clear
     "critical_timer": None,                # Timer for critical zone all-clear
     "warning_active": False,               # Is warning alert currently active?
     "critical_active": False,              # Is critical alert currently active?
-    "last_warning_strike": None,           # Timestamp of last warning zone strike
-    "last_critical_strike": None,          # Timestamp of last critical zone strike
-    "timer_lock": threading.Lock(),        # Protects timer operations
-    "active_timers": []                    # Track all active timers
+    "last_warning_strike": None,           # Epoch timestamp of last warning zone strike
+    "last_critical_strike": None,          # Epoch timestamp of last critical zone strike
+    "last_warning_strike_mono": None,      # Monotonic time of last warning strike (all-clear checks)
+    "last_critical_strike_mono": None,     # Monotonic time of last critical strike (all-clear checks)
+    "timer_lock": threading.Lock()         # Protects timer operations
 }
 
-# Slack notification queue for non-blocking alerts
-SLACK_QUEUE = Queue(maxsize=100)
+# Single scheduler thread for all-clear and noise-floor revert timers
+ALERT_SCHEDULER = AlertScheduler()
+
+# Slack notification queues for non-blocking alerts, split by urgency so a
+# full queue can evict the oldest routine message in O(1). Entries are
+# (sequence, message) and the worker merges both queues in sequence order.
+SLACK_URGENT_QUEUE = deque()           # CRITICAL / WARNING alerts
+SLACK_QUEUE = deque()                  # Everything else (all-clear, info)
+SLACK_QUEUE_MAX = 100                  # Combined capacity of both queues
+SLACK_QUEUE_SEQ = itertools.count()
+SLACK_QUEUE_LOCK = threading.Lock()    # Guards both queues, the sequence and dedup state
+SLACK_DEDUP_WINDOW = 30.0              # Seconds an identical repeat is suppressed
+SLACK_LAST_QUEUED = [None, 0.0]        # (level, previous level, message) key, monotonic time
+SLACK_EVENT = threading.Event()        # Set when messages are queued or on shutdown
+SLACK_STOP = threading.Event()         # Tells the worker to drain and exit
 SLACK_WORKER_THREAD = None
 
-# Sensor instance and initialization lock
-# The lock ensures only one thread can initialize/access the sensor at a time
+# Background listener that performs log file/console I/O
+LOG_LISTENER = None
+
+# Set once cleanup_resources() starts; it runs from both the __main__
+# finally block and atexit, and must only run once
+SHUTDOWN_EVENT = threading.Event()
+
+# Sensor instance and locks
+# SENSOR_INIT_LOCK serializes multi-register sensor sequences: creating or
+# tearing down the sensor, noise floor raise/revert (disturber, noise-high
+# and revert handlers) and force_recalibrate, so none of them interleave.
+# SENSOR_IO_LOCK is held for each individual SPI transfer.
 SENSOR_INIT_LOCK = threading.Lock()
+SENSOR_IO_LOCK = threading.Lock()
 sensor = None  # Global sensor object
 
 # --- Flask Application Setup ---
@@ -171,6 +598,37 @@ app.config['MAX_CONTENT_LENGTH'] = 16 * 1024 * 1024  # 16MB max request size
 # Set request timeout
 WSGIRequestHandler.timeout = 30
 
+class OrjsonProvider(DefaultJSONProvider):
+    """Flask JSON provider that encodes with orjson (used by jsonify)"""
+
+    def dumps(self, obj, **kwargs):
+        return orjson.dumps(obj, default=self.default, option=orjson.OPT_NON_STR_KEYS).decode()
+
+    def loads(self, s, **kwargs):
+        return orjson.loads(s)
+
+if orjson is not None:
+    app.json = OrjsonProvider(app)
+
+def json_dumps_bytes(obj):
+    """Encode obj as UTF-8 JSON bytes using the fastest available backend"""
+    if orjson is not None:
+        return orjson.dumps(obj)
+    return json.dumps(obj, ensure_ascii=False).encode('utf-8')
+
+@app.template_filter('fmtts')
+@functools.lru_cache(maxsize=256)
+def format_timestamp_filter(timestamp):
+    """
+    Jinja filter: format an epoch timestamp for display
+
+    Memoized: event timestamps never change, so each one is formatted once
+    rather than on every dashboard refresh.
+    """
+    if not timestamp:
+        return 'Unknown'
+    return datetime.fromtimestamp(timestamp).strftime('%Y-%m-%d %H:%M:%S')
+
 # --- AS3935 Sensor Driver Class with gpiozero ---
 class AS3935LightningDetector:
     """
@@ -187,44 +645,47 @@ class AS3935LightningDetector:
     REG_DISP_LCO = 0x08    # Display oscillator on IRQ pin for tuning
     REG_PRESET = 0x3C      # Preset register for testing
 
+    # Register values
+    DIRECT_COMMAND = 0x96             # Written to REG_PRESET: reset to defaults
+    AFE_OUTDOOR = 0b00011100          # AFE_GB=01110 (14x gain), powered up
+    AFE_INDOOR = 0b00100100           # AFE_GB=10010 (18x gain), powered up
+    NF_WDTH_MAX = (0x07 << 4) | 0x0F  # Max noise floor, max watchdog threshold
+    MASK_DIST_BIT = 1 << 5            # MASK_DIST in REG_MASK_DIST
+
     # Interrupt reason bit masks
     INT_NH = 0x01          # Noise level too high
     INT_D  = 0x04          # Disturber detected
     INT_L  = 0x08          # Lightning detected
 
-    def __init__(self, spi_bus=0, spi_device=0, irq_pin=2):
+    # Prebuilt single-register read frames, indexed by register address.
+    # Tuples are passed to xfer2 as-is (no per-call list allocation) and,
+    # being immutable, are safe to share between threads.
+    _READ_FRAMES = tuple((reg | 0x40, 0x00) for reg in range(0x40))
+
+    def __init__(self, cfg):
         """
         Initialize the AS3935 sensor using gpiozero
 
         Args:
-            spi_bus: SPI bus number (0 or 1 on Raspberry Pi)
-            spi_device: SPI chip select (0 or 1)
-            irq_pin: GPIO pin number for interrupt signal (BCM numbering)
+            cfg: SensorConfig with SPI bus/device, IRQ pin (BCM numbering),
+                 SPI mode/speed, IRQ polarity and sensitivity settings
         """
+        self.cfg = cfg
         self.spi = None
-        self.irq_pin = irq_pin
+        self.irq_pin = cfg.irq_pin
         self.irq_button = None
         self.is_initialized = False
         self.original_noise_floor = 0x02  # Default noise floor level
         self.interrupt_callback = None
-
-        # Read sensor-related config (with safe fallbacks)
-        try:
-            self.active_high = get_config_boolean('SENSOR', 'irq_active_high', True)
-            spi_mode = get_config_int('SENSOR', 'spi_mode', 1)
-            spi_max_hz = get_config_int('SENSOR', 'spi_max_hz', 2000000)
-        except Exception:
-            self.active_high = True
-            spi_mode = 1
-            spi_max_hz = 2000000
+        self.active_high = cfg.active_high
 
         try:
             # Initialize SPI communication
             self.spi = spidev.SpiDev()
-            self.spi.open(spi_bus, spi_device)
+            self.spi.open(cfg.spi_bus, cfg.spi_device)
             # Respect config for SPI mode/speed
-            self.spi.max_speed_hz = int(spi_max_hz)
-            self.spi.mode = [0, 1, 2, 3][min(max(int(spi_mode), 0), 3)]
+            self.spi.max_speed_hz = cfg.spi_max_hz
+            self.spi.mode = [0, 1, 2, 3][min(max(cfg.spi_mode, 0), 3)]
 
             # Configure GPIO for interrupt pin using gpiozero Button
             # Polarity/edge:
@@ -234,7 +695,9 @@ class AS3935LightningDetector:
             self.irq_button = Button(
                 pin=self.irq_pin,
                 pull_up=pull_up,
-                bounce_time=0.002  # short debounce; IRQ is a brief pulse
+                # No debounce: the AS3935 drives IRQ and holds it until INT is
+                # read, and a backend glitch filter would only delay the edge
+                bounce_time=None
             )
 
             app.logger.debug(
@@ -242,8 +705,16 @@ class AS3935LightningDetector:
                 f"(backend: {GPIO_BACKEND}, active_high={self.active_high}, pull_up={pull_up})"
             )
 
-            # Let the pin settle
-            time.sleep(0.1)
+            # Let the pin settle. pigpiod samples and debounces the line itself,
+            # so there it is enough to wait for two matching reads 5ms apart.
+            if GPIO_BACKEND == "pigpio":
+                for _ in range(20):
+                    previous = self.irq_button.is_pressed
+                    time.sleep(0.005)
+                    if self.irq_button.is_pressed == previous:
+                        break
+            else:
+                time.sleep(0.1)
 
             # Log idle state
             idle_pressed = self.irq_button.is_pressed
@@ -265,6 +736,44 @@ class AS3935LightningDetector:
             self.cleanup()
             raise e
 
+    def _xfer(self, frame, retries, operation):
+        """
+        Run one SPI transfer, retrying only if it raises IOError
+
+        Transfers are serialized on SENSOR_IO_LOCK so concurrent callers
+        (monitoring thread, web routes, health checks) never interleave.
+
+        The common path is a single xfer2 call; the retry loop and its
+        back-off delay are only entered after a failure.
+
+        Args:
+            frame: Bytes to clock out (list or tuple)
+            retries: Total number of attempts
+            operation: Description used in the failure log message
+
+        Returns:
+            List of bytes clocked in
+        """
+        with SENSOR_IO_LOCK:
+            spi = self.spi
+            if spi is None:
+                raise IOError(f"SPI {operation} on closed device")
+
+            try:
+                return spi.xfer2(frame)
+            except IOError as e:
+                error = e
+
+            for _ in range(retries - 1):
+                time.sleep(0.001)  # Brief delay before retry
+                try:
+                    return spi.xfer2(frame)
+                except IOError as e:
+                    error = e
+
+        app.logger.error(f"SPI {operation} failed after {retries} attempts: {error}")
+        raise error
+
     def _write_register(self, reg, value, retries=3):
         """
         Write a value to a sensor register with retry logic
@@ -277,16 +786,27 @@ class AS3935LightningDetector:
         if not self.spi:
             return
 
-        for attempt in range(retries):
-            try:
-                # AS3935 expects [register_address, data_byte]
-                self.spi.xfer2([reg, value])
-                return
-            except IOError as e:
-                if attempt == retries - 1:
-                    app.logger.error(f"SPI write failed after {retries} attempts: {e}")
-                    raise
-                time.sleep(0.001)  # Brief delay before retry
+        # AS3935 expects (register_address, data_byte)
+        self._xfer((reg, value), retries, "write")
+        invalidate_check_sensor()
+
+    def _write_registers(self, start_reg, values, retries=3):
+        """
+        Write consecutive registers in a single SPI transaction
+
+        The AS3935 auto-increments its register pointer during writes, so the
+        whole block is configured at once instead of register by register.
+
+        Args:
+            start_reg: First register address (0x00-0x3F)
+            values: 8-bit values for start_reg, start_reg + 1, ...
+            retries: Number of retry attempts on failure
+        """
+        if not self.spi:
+            return
+
+        self._xfer([start_reg] + list(values), retries, "burst write")
+        invalidate_check_sensor()
 
     def _read_register(self, reg, retries=3):
         """
@@ -302,17 +822,28 @@ class AS3935LightningDetector:
         if not self.spi:
             return 0
 
-        for attempt in range(retries):
-            try:
-                # AS3935 read: set bit 6 of address byte, then read response
-                result = self.spi.xfer2([reg | 0x40, 0x00])
-                return result[1]
-            except IOError as e:
-                if attempt == retries - 1:
-                    app.logger.error(f"SPI read failed after {retries} attempts: {e}")
-                    raise
-                time.sleep(0.001)
-        return 0
+        # AS3935 read: set bit 6 of address byte, then read response
+        return self._xfer(self._READ_FRAMES[reg], retries, "read")[1]
+
+    def _read_registers(self, start_reg, count, retries=3):
+        """
+        Read consecutive registers in a single SPI transaction
+
+        The AS3935 auto-increments its register pointer during reads, so one
+        burst replaces `count` separate transfers.
+
+        Args:
+            start_reg: First register address (0x00-0x3F)
+            count: Number of consecutive registers to read
+            retries: Number of retry attempts on failure
+
+        Returns:
+            List of 8-bit register values
+        """
+        if not self.spi:
+            return [0] * count
+
+        return self._xfer([start_reg | 0x40] + [0x00] * count, retries, "burst read")[1:]
 
     def power_up(self):
         """
@@ -322,7 +853,7 @@ class AS3935LightningDetector:
         try:
             # CRITICAL FIX 1: Send direct reset command FIRST
             app.logger.info("Performing AS3935 reset...")
-            self._write_register(0x3C, 0x96)  # Direct reset command
+            self._write_register(self.REG_PRESET, self.DIRECT_COMMAND)
             time.sleep(0.002)
 
             # CRITICAL FIX 2: Clear power down bit
@@ -336,26 +867,16 @@ class AS3935LightningDetector:
                 time.sleep(0.002)
 
             # Get configuration
-            try:
-                is_indoor = get_config_boolean('SENSOR', 'indoor', True)  # True for BBQ lighter testing
-                sensitivity = CONFIG.get('SENSOR', 'sensitivity', fallback='high')
-                if sensitivity is None:
-                    sensitivity = 'high'
-            except Exception as config_error:
-                app.logger.warning(f"Config access error in power_up: {config_error}. Using defaults.")
-                is_indoor = True
-                sensitivity = 'high'
+            is_indoor = self.cfg.indoor  # True for BBQ lighter testing
+            sensitivity = self.cfg.sensitivity
 
             # Configure AFE Gain for indoor/outdoor
             if is_indoor:
                 # Indoor: AFE_GB=10010 (18x gain) - MORE SENSITIVE
-                afe_gain = 0b00100100  # Corrected value for indoor
+                afe_gain = self.AFE_INDOOR
             else:
                 # Outdoor: AFE_GB=01110 (14x gain)
-                afe_gain = 0b00011100
-
-            self._write_register(0x00, afe_gain)
-            time.sleep(0.002)
+                afe_gain = self.AFE_OUTDOOR
 
             # Sensitivity presets
             if sensitivity == 'high':
@@ -373,25 +894,20 @@ class AS3935LightningDetector:
 
             self.original_noise_floor = nf_lev
 
-            # Set noise floor and watchdog
+            # Write AFE gain (0x00), noise floor/watchdog (0x01) and
+            # spike rejection (0x02) in one burst
             reg01_value = (nf_lev << 4) | wdth
-            self._write_register(0x01, reg01_value)
-            time.sleep(0.002)
-
-            # Set spike rejection (register 0x02)
-            self._write_register(0x02, srej << 4)
-            time.sleep(0.002)
+            self._write_registers(0x00, [afe_gain, reg01_value, srej << 4])
 
             # CRITICAL FIX 4: Ensure MASK_DIST bit is CLEARED (bit 5 of register 0x03)
             reg03 = self._read_register(0x03)
-            reg03 = reg03 & ~(1 << 5)  # Clear bit 5 (MASK_DIST)
+            reg03 = reg03 & ~self.MASK_DIST_BIT
 
             # FIXED: DO NOT MASK INT_NH - We want to see ALL interrupts including noise
             # This was preventing detection of piezo lighters
             app.logger.info("All interrupts enabled (including INT_NH for noise detection)")
 
             self._write_register(0x03, reg03)
-            time.sleep(0.002)
 
             # Verify MASK_DIST is cleared
             reg03_check = self._read_register(0x03)
@@ -414,19 +930,17 @@ class AS3935LightningDetector:
 
             # Update global status
             try:
-                with MONITORING_STATE['lock']:
-                    MONITORING_STATE['status']['indoor_mode'] = is_indoor
-                    MONITORING_STATE['status']['sensor_healthy'] = True
-                    MONITORING_STATE['status']['use_imperial'] = get_distance_unit()
+                update_status(indoor_mode=is_indoor, sensor_healthy=True, use_imperial=get_distance_unit())
             except Exception as state_error:
                 app.logger.warning(f"State update error in power_up: {state_error}")
 
             # Log final configuration
+            reg00, reg01, reg02, reg03 = self._read_registers(0x00, 4)
             final_regs = {
-                "0x00 (AFE/PWD)": f"0x{self._read_register(0x00):02X}",
-                "0x01 (NF/WDTH)": f"0x{self._read_register(0x01):02X}",
-                "0x02 (SREJ)": f"0x{self._read_register(0x02):02X}",
-                "0x03 (INT/MASK)": f"0x{self._read_register(0x03):02X}",
+                "0x00 (AFE/PWD)": f"0x{reg00:02X}",
+                "0x01 (NF/WDTH)": f"0x{reg01:02X}",
+                "0x02 (SREJ)": f"0x{reg02:02X}",
+                "0x03 (INT/MASK)": f"0x{reg03:02X}",
             }
             app.logger.info(
                 f"AS3935 initialized - Mode: {'Indoor' if is_indoor else 'Outdoor'}, "
@@ -434,15 +948,13 @@ class AS3935LightningDetector:
             )
             app.logger.info(f"Final registers: {final_regs}")
 
-            # Check if interrupts are working
-            int_reg = self._read_register(0x03) & 0x0F
+            # Check if interrupts are working (from the burst read above)
+            int_reg = reg03 & 0x0F
             app.logger.info(f"Current interrupt status: 0x{int_reg:02X}")
 
         except Exception as e:
             try:
-                with MONITORING_STATE['lock']:
-                    MONITORING_STATE['status']['sensor_healthy'] = False
-                    MONITORING_STATE['status']['last_error'] = str(e)
+                update_status(sensor_healthy=False, last_error=str(e))
             except:
                 pass
             raise
@@ -514,9 +1026,7 @@ class AS3935LightningDetector:
 
         except IOError as e:
             app.logger.error(f"SPI Error setting noise floor: {e}")
-            with MONITORING_STATE['lock']:
-                MONITORING_STATE['status']['sensor_healthy'] = False
-                MONITORING_STATE['status']['last_error'] = str(e)
+            update_status(sensor_healthy=False, last_error=str(e))
 
     def get_interrupt_reason(self):
         """Read interrupt status register to determine interrupt cause"""
@@ -538,10 +1048,43 @@ class AS3935LightningDetector:
         Returns:
             20-bit energy value
         """
-        lsb = self._read_register(0x04)
-        msb = self._read_register(0x05)
-        mmsb = self._read_register(0x06) & 0x1F
-        return (mmsb << 16) | (msb << 8) | lsb
+        lsb, msb, mmsb = self._read_registers(0x04, 3)
+        return ((mmsb & 0x1F) << 16) | (msb << 8) | lsb
+
+    def get_lightning_data(self):
+        """
+        Read energy and distance of the last strike in one burst (0x04-0x07)
+
+        Returns:
+            Tuple of (distance_km, energy)
+        """
+        lsb, msb, mmsb, dist = self._read_registers(0x04, 4)
+        return dist & 0x3F, ((mmsb & 0x1F) << 16) | (msb << 8) | lsb
+
+    def clear_interrupts(self):
+        """
+        Clear a latched interrupt
+
+        INT (0x03) is cleared by reading it, so one transfer is enough;
+        repeated back-to-back reads only return 0.
+
+        Returns:
+            Interrupt source bits that were latched (0 if none)
+        """
+        return self._read_register(0x03) & 0x0F
+
+    def get_interrupt_data(self):
+        """
+        Read interrupt reason, distance and energy in one burst (0x03-0x07)
+
+        Reading INT (0x03) clears the interrupt, so everything an interrupt
+        handler needs is captured in the same transfer.
+
+        Returns:
+            Tuple of (reason, distance_km, energy)
+        """
+        reg03, lsb, msb, mmsb, dist = self._read_registers(0x03, 5)
+        return reg03 & 0x0F, dist & 0x3F, ((mmsb & 0x1F) << 16) | (msb << 8) | lsb
 
     def verify_spi_connection(self):
         """
@@ -576,10 +1119,11 @@ class AS3935LightningDetector:
                 self.irq_button = None
                 app.logger.debug(f"gpiozero Button for GPIO{self.irq_pin} closed")
 
-            # Clean up SPI
-            if self.spi:
-                self.spi.close()
-                self.spi = None
+            # Clean up SPI (no transfer may be in flight on the closed fd)
+            with SENSOR_IO_LOCK:
+                if self.spi:
+                    self.spi.close()
+                    self.spi = None
 
             app.logger.info(f"Sensor resources cleaned up (gpiozero)")
 
@@ -587,6 +1131,33 @@ class AS3935LightningDetector:
             app.logger.error(f"Error during hardware cleanup: {e}")
 
 # --- Configuration Helper Functions ---
+# Parsed get_config_* results; replaced wholesale by invalidate_config_cache()
+_CONFIG_CACHE = {}
+
+def invalidate_config_cache():
+    """Drop all cached config values (CONFIG was re-read or modified)"""
+    global _CONFIG_CACHE
+    _CONFIG_CACHE = {}
+
+def _config_cached(getter):
+    """Memoize a get_config_* helper until the next invalidate_config_cache()"""
+    @functools.wraps(getter)
+    def wrapper(section, key, fallback):
+        cache = _CONFIG_CACHE  # A concurrent invalidation swaps the dict, so a stale store is discarded
+        cache_key = (getter, section, key, fallback)
+        try:
+            return cache[cache_key]
+        except KeyError:
+            value = cache[cache_key] = getter(section, key, fallback)
+            return value
+    return wrapper
+
+@_config_cached
+def get_config_str(section, key, fallback):
+    """Retrieve a string value from configuration (fallback if missing)"""
+    return CONFIG.get(section, key, fallback=fallback)
+
+@_config_cached
 def get_config_int(section, key, fallback):
     """
     Safely retrieve an integer value from configuration
@@ -609,6 +1180,7 @@ def get_config_int(section, key, fallback):
             app.logger.warning(f"Invalid or missing value for '{key}' in [{section}]. Using fallback: {fallback}.")
         return fallback
 
+@_config_cached
 def get_config_float(section, key, fallback):
     """Safely retrieve a float value from configuration"""
     try:
@@ -621,6 +1193,7 @@ def get_config_float(section, key, fallback):
             app.logger.warning(f"Invalid or missing value for '{key}' in [{section}]. Using fallback: {fallback}.")
         return fallback
 
+@_config_cached
 def get_config_boolean(section, key, fallback):
     """Safely retrieve a boolean value from configuration"""
     try:
@@ -638,10 +1211,115 @@ def get_config_boolean(section, key, fallback):
             app.logger.warning(f"Invalid or missing value for '{key}' in [{section}]. Using fallback: {fallback}.")
         return fallback
 
+def build_runtime_config():
+    """
+    Parse the hot-path settings from CONFIG into a RuntimeConfig
+
+    Returns:
+        New RuntimeConfig instance
+    """
+    return RuntimeConfig(
+        energy_threshold=get_config_int('ALERTS', 'energy_threshold', 100000),
+        critical_distance=get_config_int('ALERTS', 'critical_distance', 10),
+        warning_distance=get_config_int('ALERTS', 'warning_distance', 30),
+        all_clear_timer=get_config_int('ALERTS', 'all_clear_timer', 15),
+        slack_enabled=get_config_boolean('SLACK', 'enabled', False),
+        slack_configured=bool(get_config_str('SLACK', 'bot_token', '')),
+        use_imperial=get_config_boolean('DISPLAY', 'use_imperial_units', True),
+        noise_handling=get_config_boolean('NOISE_HANDLING', 'enabled', False),
+        noise_event_threshold=get_config_int('NOISE_HANDLING', 'event_threshold', 15),
+        noise_window_seconds=get_config_int('NOISE_HANDLING', 'time_window_seconds', 120),
+        noise_revert_seconds=get_config_int('NOISE_HANDLING', 'revert_delay_minutes', 10) * 60,
+        raised_noise_floor_level=get_config_int('NOISE_HANDLING', 'raised_noise_floor_level', 5),
+        config_valid=validate_config()
+    )
+
+def build_sensor_config():
+    """
+    Parse the [SENSOR] section into a SensorConfig
+
+    Returns:
+        New SensorConfig instance
+    """
+    sensitivity = CONFIG.get('SENSOR', 'sensitivity', fallback='high') or 'high'
+    return SensorConfig(
+        spi_bus=get_config_int('SENSOR', 'spi_bus', 0),
+        spi_device=get_config_int('SENSOR', 'spi_device', 0),
+        irq_pin=get_config_int('SENSOR', 'irq_pin', 2),
+        spi_mode=get_config_int('SENSOR', 'spi_mode', 1),
+        spi_max_hz=get_config_int('SENSOR', 'spi_max_hz', 2000000),
+        active_high=get_config_boolean('SENSOR', 'irq_active_high', True),
+        indoor=get_config_boolean('SENSOR', 'indoor', True),
+        sensitivity=sensitivity
+    )
+
+def refresh_runtime_config():
+    """Rebuild RUNTIME_CFG from CONFIG (call after every config load/save)"""
+    global RUNTIME_CFG
+    invalidate_config_cache()
+    with RUNTIME_CFG_LOCK:
+        # Build the new snapshot first, then swap the reference atomically
+        RUNTIME_CFG = build_runtime_config()
+
+    if RUNTIME_CFG.slack_enabled and not RUNTIME_CFG.slack_configured:
+        app.logger.warning("Slack is enabled, but Bot Token is not configured")
+
+# --- Configuration Persistence ---
+CONFIG_WRITER = ThreadPoolExecutor(max_workers=1)  # Serializes config.ini saves
+
+def write_config_file(text, path='config.ini'):
+    """
+    Atomically replace the configuration file
+
+    The text is written to a temporary file in the same directory, flushed
+    to disk and renamed over the original, so a crash never leaves a
+    truncated config.ini behind.
+
+    Args:
+        text: Complete INI file contents
+        path: Configuration file path
+    """
+    tmp_path = f"{path}.tmp"
+    with open(tmp_path, 'w') as configfile:
+        configfile.write(text)
+        configfile.flush()
+        os.fsync(configfile.fileno())
+    os.replace(tmp_path, path)
+
+def save_config_async(path='config.ini'):
+    """
+    Serialize CONFIG and queue the atomic file write on the config writer thread
+
+    Returns:
+        True if the write was queued, False otherwise
+    """
+    buffer = io.StringIO()
+    CONFIG.write(buffer)
+
+    def log_result(future):
+        error = future.exception()
+        if error:
+            app.logger.error(f"Configuration write to {path} failed: {error}")
+        else:
+            app.logger.debug(f"Configuration written to {path}")
+
+    try:
+        future = CONFIG_WRITER.submit(write_config_file, buffer.getvalue(), path)
+    except RuntimeError as e:  # Executor already shut down
+        app.logger.error(f"Configuration write could not be queued: {e}")
+        return False
+    future.add_done_callback(log_result)
+    return True
+
 def validate_config():
     """
     Validate critical configuration values
 
+    Called once per configuration load/save by build_runtime_config(); the
+    result is kept as RUNTIME_CFG.config_valid. The get_config_* helpers
+    always return typed values (falling back to the defaults), so only
+    ranges and relationships need checking here.
+
     Returns:
         True if configuration is valid, False otherwise
     """
@@ -649,149 +1327,85 @@ def validate_config():
     warnings = []
 
     try:
-        # Get unit preference
         use_imperial = get_config_boolean('DISPLAY', 'use_imperial_units', True)
+        min_dist = format_distance(1, use_imperial)
+        max_dist = format_distance(63, use_imperial)  # AS3935 max distance
 
-        # Validate distance settings with safe comparisons
+        # Distance settings
         critical_km = get_config_int('ALERTS', 'critical_distance', 10)
         warning_km = get_config_int('ALERTS', 'warning_distance', 30)
-
-        # Debug logging
-        if 'app' in globals() and hasattr(app, 'logger'):
-            if use_imperial:
-                app.logger.debug(f"Config validation: critical={format_distance(critical_km, True)}, warning={format_distance(warning_km, True)}")
-            else:
-                app.logger.debug(f"Config validation: critical={critical_km}km, warning={warning_km}km")
-
-        # Ensure we have valid integers
-        if critical_km is None:
-            critical_km = 10
-            warnings.append("Critical distance was None, using default 10km")
-        if warning_km is None:
-            warning_km = 30
-            warnings.append("Warning distance was None, using default 30km")
-
-        # Convert to int to be absolutely sure
-        try:
-            critical_km = int(critical_km)
-            warning_km = int(warning_km)
-        except (ValueError, TypeError) as e:
-            errors.append(f"Distance values are not valid integers: critical={critical_km}, warning={warning_km}")
-            if 'app' in globals() and hasattr(app, 'logger'):
-                app.logger.error(f"Distance conversion error: {e}")
-            return False
+        app.logger.debug(
+            f"Config validation: critical={format_distance(critical_km, use_imperial)}, "
+            f"warning={format_distance(warning_km, use_imperial)}"
+        )
 
         if critical_km >= warning_km:
             errors.append(f"Critical distance must be less than warning distance ({format_distance(critical_km, use_imperial)} >= {format_distance(warning_km, use_imperial)})")
+        if not 1 <= critical_km <= 63:
+            errors.append(f"Critical distance must be between {min_dist} and {max_dist}")
+        if not 1 <= warning_km <= 63:
+            errors.append(f"Warning distance must be between {min_dist} and {max_dist}")
 
-        if critical_km < 1 or critical_km > 63:  # AS3935 max distance
-            errors.append(f"Critical distance must be between {format_distance(1, use_imperial)} and {format_distance(63, use_imperial)}")
-
-        if warning_km < 1 or warning_km > 63:
-            errors.append(f"Warning distance must be between {format_distance(1, use_imperial)} and {format_distance(63, use_imperial)}")
-
-        # Validate SPI settings
-        spi_bus = get_config_int('SENSOR', 'spi_bus', 0)
-        if spi_bus is None:
-            spi_bus = 0
-            warnings.append("SPI bus was None, using default 0")
-
-        try:
-            spi_bus = int(spi_bus)
-        except (ValueError, TypeError):
-            errors.append(f"SPI bus is not a valid integer: {spi_bus}")
-            return False
-
-        if spi_bus not in [0, 1]:
+        # SPI settings
+        if get_config_int('SENSOR', 'spi_bus', 0) not in (0, 1):
             errors.append("SPI bus must be 0 or 1")
 
-        # Validate GPIO pin
+        # GPIO pin
         irq_pin = get_config_int('SENSOR', 'irq_pin', 2)
-        if irq_pin is None:
-            irq_pin = 2
-            warnings.append("IRQ pin was None, using default 2")
-
-        try:
-            irq_pin = int(irq_pin)
-        except (ValueError, TypeError):
-            errors.append(f"IRQ pin is not a valid integer: {irq_pin}")
-            return False
-
-        if irq_pin < 0 or irq_pin > 27:  # BCM pin range
+        if not 0 <= irq_pin <= 27:  # BCM pin range
             errors.append("IRQ pin must be between 0 and 27")
-
-        # Check for reserved pins
-        reserved_pins = [0, 1, 14, 15]  # UART pins
-        if irq_pin in reserved_pins:
+        if irq_pin in (0, 1, 14, 15):  # I2C EEPROM / UART pins
             warnings.append(f"IRQ pin {irq_pin} may conflict with system functions")
 
-        # Validate noise handling settings
+        # Noise handling settings
         if get_config_boolean('NOISE_HANDLING', 'enabled', True):
             event_threshold = get_config_int('NOISE_HANDLING', 'event_threshold', 15)
-            if event_threshold is None:
-                event_threshold = 15
-                warnings.append("Event threshold was None, using default 15")
-
-            try:
-                event_threshold = int(event_threshold)
-            except (ValueError, TypeError):
-                errors.append(f"Event threshold is not a valid integer: {event_threshold}")
-                return False
-
             if event_threshold < 5:
                 warnings.append("Event threshold < 5 may cause frequent noise floor changes")
             elif event_threshold > 50:
                 warnings.append("Event threshold > 50 may not respond to noise quickly enough")
 
-            noise_floor = get_config_int('NOISE_HANDLING', 'raised_noise_floor_level', 5)
-            if noise_floor is None:
-                noise_floor = 5
-                warnings.append("Noise floor level was None, using default 5")
-
-            try:
-                noise_floor = int(noise_floor)
-            except (ValueError, TypeError):
-                errors.append(f"Noise floor level is not a valid integer: {noise_floor}")
-                return False
-
-            if noise_floor < 0 or noise_floor > 7:
+            if not 0 <= get_config_int('NOISE_HANDLING', 'raised_noise_floor_level', 5) <= 7:
                 errors.append("Raised noise floor level must be between 0 and 7")
 
     except Exception as e:
         errors.append(f"Configuration validation error: {str(e)}")
-        if 'app' in globals() and hasattr(app, 'logger'):
-            app.logger.error(f"Exception during config validation: {e}", exc_info=True)
-
-    # Log warnings and errors safely
-    if 'app' in globals() and hasattr(app, 'logger'):
-        for warning in warnings:
-            app.logger.warning(f"Configuration warning: {warning}")
+        app.logger.error(f"Exception during config validation: {e}", exc_info=True)
 
-        for error in errors:
-            app.logger.error(f"Configuration error: {error}")
-    else:
-        # Fallback logging if app.logger not available
-        for warning in warnings:
-            print(f"Configuration warning: {warning}")
-        for error in errors:
-            print(f"Configuration error: {error}")
+    for warning in warnings:
+        app.logger.warning(f"Configuration warning: {warning}")
+    for error in errors:
+        app.logger.error(f"Configuration error: {error}")
 
     return len(errors) == 0
 
 # --- Sensor Initialization and Management ---
-def initialize_sensor_with_retry(max_retries=5, retry_delay=5):
+def initialize_sensor_with_retry(max_retries=None, retry_delay=None, backoff_base=None):
     """
     Initialize sensor with exponential backoff retry logic
 
+    Unset arguments come from [SENSOR] init_max_retries (8),
+    init_retry_delay (5 s) and init_backoff_base (1.3), giving nominal
+    delays of 5, 6.5, 8.45, 11, ... seconds. Each delay is jittered by
+    +/-50% so detectors restarted together don't retry in lockstep.
+
     Args:
         max_retries: Maximum number of initialization attempts
-        retry_delay: Base delay between retries (exponentially increased)
+        retry_delay: Base delay between retries in seconds
+        backoff_base: Multiplier applied to the delay after each attempt
 
     Returns:
         True if initialization successful, False otherwise
     """
     global sensor
 
+    if max_retries is None:
+        max_retries = get_config_int('SENSOR', 'init_max_retries', 8)
+    if retry_delay is None:
+        retry_delay = get_config_float('SENSOR', 'init_retry_delay', 5.0)
+    if backoff_base is None:
+        backoff_base = get_config_float('SENSOR', 'init_backoff_base', 1.3)
+
     for attempt in range(max_retries):
         try:
             with SENSOR_INIT_LOCK:
@@ -800,135 +1414,128 @@ def initialize_sensor_with_retry(max_retries=5, retry_delay=5):
                     sensor.cleanup()
                     sensor = None
 
-                # Get config values with detailed logging
-                spi_bus = get_config_int('SENSOR', 'spi_bus', 0)
-                spi_device = get_config_int('SENSOR', 'spi_device', 0)
-                irq_pin = get_config_int('SENSOR', 'irq_pin', 2)
-
-                app.logger.debug(f"Config values: spi_bus={spi_bus} (type: {type(spi_bus)}), "
-                                 f"spi_device={spi_device} (type: {type(spi_device)}), "
-                                 f"irq_pin={irq_pin} (type: {type(irq_pin)})")
-
-                # Ensure all values are valid integers
-                if spi_bus is None:
-                    spi_bus = 0
-                if spi_device is None:
-                    spi_device = 0
-                if irq_pin is None:
-                    irq_pin = 2
-
-                # Convert to int if they're not already
-                spi_bus = int(spi_bus)
-                spi_device = int(spi_device)
-                irq_pin = int(irq_pin)
-
-                app.logger.debug(f"Final values: spi_bus={spi_bus}, spi_device={spi_device}, irq_pin={irq_pin}")
+                # Parse [SENSOR] settings once for this sensor instance
+                sensor_cfg = build_sensor_config()
+                app.logger.debug("Sensor config: %s", sensor_cfg)
 
                 # Create new sensor instance
-                sensor = AS3935LightningDetector(
-                    spi_bus=spi_bus,
-                    spi_device=spi_device,
-                    irq_pin=irq_pin
-                )
+                sensor = AS3935LightningDetector(sensor_cfg)
 
                 # Verify sensor is responsive by reading a register
                 test_value = sensor._read_register(0x00)
-                app.logger.info(f"Sensor initialized successfully with gpiozero (test read: {test_value:#04x})")
+                app.logger.info("Sensor initialized successfully with gpiozero (test read: %#04x)", test_value)
 
                 # Update global status
-                with MONITORING_STATE['lock']:
-                    MONITORING_STATE['status']['sensor_active'] = True
-                    MONITORING_STATE['status']['sensor_healthy'] = True
-                    MONITORING_STATE['status']['status_message'] = f"Monitoring (Event-Driven, {GPIO_BACKEND})"
-                    MONITORING_STATE['status']['last_error'] = None
-                    MONITORING_STATE['status']['use_imperial'] = get_distance_unit()
+                update_status(
+                    sensor_active=True,
+                    sensor_healthy=True,
+                    status_message=STATUS_MONITORING,
+                    last_error=None,
+                    use_imperial=get_distance_unit()
+                )
 
                 return True
 
         except Exception as e:
-            app.logger.error(f"Sensor init attempt {attempt + 1}/{max_retries} failed: {e}")
-            # Add traceback for better debugging
-            import traceback
-            app.logger.error(f"Full traceback: {traceback.format_exc()}")
+            # exc_info adds the traceback without formatting it up front
+            app.logger.error("Sensor init attempt %d/%d failed: %s", attempt + 1, max_retries, e,
+                             exc_info=True)
 
             # Update status with failure information
-            with MONITORING_STATE['lock']:
-                MONITORING_STATE['status']['sensor_active'] = False
-                MONITORING_STATE['status']['sensor_healthy'] = False
-                MONITORING_STATE['status']['last_error'] = str(e)
-                MONITORING_STATE['status']['status_message'] = f"Init failed (attempt {attempt + 1})"
+            update_status(
+                sensor_active=False,
+                sensor_healthy=False,
+                last_error=str(e),
+                status_message=f"Init failed (attempt {attempt + 1})"
+            )
 
             # Wait before retry with exponential backoff
             if attempt < max_retries - 1:
-                delay = retry_delay * (2 ** attempt)  # Exponential backoff
-                app.logger.info(f"Waiting {delay}s before retry...")
+                delay = retry_delay * (backoff_base ** attempt)  # Exponential backoff
+                delay = random.uniform(0.5 * delay, 1.5 * delay)  # Jitter
+                app.logger.info("Waiting %.1fs before retry...", delay)
 
-                # Interruptible sleep
-                for _ in range(delay * 10):
-                    if MONITORING_STATE['stop_event'].is_set():
-                        return False
-                    time.sleep(0.1)
+                # Interruptible sleep: wakes immediately on shutdown
+                if MONITORING_STATE['stop_event'].wait(timeout=delay):
+                    return False
 
     # All retries exhausted
-    with MONITORING_STATE['lock']:
-        MONITORING_STATE['status']['status_message'] = "Fatal: Max retries exceeded"
+    update_status(status_message="Fatal: Max retries exceeded")
 
     return False
 
-def perform_sensor_health_check():
+def perform_sensor_health_check(force=False):
     """
     Perform a comprehensive health check on the sensor
 
+    Results are reused for HEALTH_TTL seconds so frequent callers don't
+    contend for the SPI bus.
+
+    Args:
+        force: Skip the cached result and talk to the sensor
+
     Returns:
         True if sensor is healthy, False otherwise
     """
+    global HEALTH_CACHE
+
+    checked_at, healthy = HEALTH_CACHE
+    if not force and time.monotonic() - checked_at < HEALTH_TTL:
+        return healthy
+
+    healthy = _check_sensor_health()
+    HEALTH_CACHE = (time.monotonic(), healthy)
+    return healthy
+
+def _check_sensor_health():
+    """
+    Run the health check against the sensor (uncached)
+
+    Only SENSOR_IO_LOCK (taken per SPI transfer) is involved, so a check
+    never waits for a sensor re-initialization to finish or blocks one.
+    """
+    dev = sensor  # Re-init may swap the global; check the instance we saw
     try:
-        with SENSOR_INIT_LOCK:
-            if not sensor or not sensor.is_initialized:
-                return False
+        if not dev or not dev.is_initialized:
+            return False
 
-            # Read and verify power register
-            pwd_reg = sensor._read_register(0x00)
-            if (pwd_reg & 0x01) != 0:  # Check if powered down
-                app.logger.warning(f"Sensor appears to be powered down: {pwd_reg:#04x}")
-                return False
+        # Read and verify power register
+        pwd_reg = dev._read_register(0x00)
+        if (pwd_reg & 0x01) != 0:  # Check if powered down
+            app.logger.warning("Sensor appears to be powered down: %#04x", pwd_reg)
+            return False
 
-            # Enhanced SPI verification
-            if not sensor.verify_spi_connection():
-                return False
+        # Enhanced SPI verification
+        if not dev.verify_spi_connection():
+            return False
+
+        # Try reading the noise floor and spike rejection registers
+        try:
+            dev._read_registers(0x01, 2)
+        except:
+            return False
 
-            # Try reading multiple registers to ensure communication
+        # Check if gpiozero button is still functional
+        if dev.irq_button and hasattr(dev.irq_button, 'is_pressed'):
             try:
-                sensor._read_register(0x01)  # Noise floor register
-                sensor._read_register(0x02)  # Spike rejection register
+                # Just checking if we can read the pin state
+                _ = dev.irq_button.is_pressed
             except:
+                app.logger.warning("GPIO pin state unreadable via gpiozero")
                 return False
 
-            # Check if gpiozero button is still functional
-            if sensor.irq_button and hasattr(sensor.irq_button, 'is_pressed'):
-                try:
-                    # Just checking if we can read the pin state
-                    _ = sensor.irq_button.is_pressed
-                except:
-                    app.logger.warning("GPIO pin state unreadable via gpiozero")
-                    return False
-
-            # Update status on success
-            with MONITORING_STATE['lock']:
-                MONITORING_STATE['status']['sensor_healthy'] = True
-                MONITORING_STATE['status']['last_error'] = None
+        # Update status on success
+        update_status(sensor_healthy=True, last_error=None)
 
-            return True
+        return True
 
     except Exception as e:
-        app.logger.error(f"Sensor health check failed: {e}")
-        with MONITORING_STATE['lock']:
-            MONITORING_STATE['status']['sensor_healthy'] = False
-            MONITORING_STATE['status']['last_error'] = str(e)
+        app.logger.error("Sensor health check failed: %s", e)
+        update_status(sensor_healthy=False, last_error=str(e))
         return False
 
 # --- Lightning Detection and Event Handling ---
-def decode_interrupt(int_val):
+def _decode_interrupt_uncached(int_val):
     """Decode interrupt value to human-readable string"""
     if int_val == 0x00:
         return "No interrupt"
@@ -941,6 +1548,18 @@ def decode_interrupt(int_val):
     else:
         return f"Unknown: 0x{int_val:02X}"
 
+# INT is a 4-bit field, so every possible value is decoded up front
+_INT_DECODE = tuple(_decode_interrupt_uncached(v) for v in range(16))
+
+def decode_interrupt(int_val):
+    """Decode interrupt value to human-readable string"""
+    return _INT_DECODE[int_val & 0x0F]
+
+def _gpio_available(dev):
+    """True if the sensor's IRQ pin is open and can be read"""
+    button = dev.irq_button
+    return button is not None and not button.closed
+
 @app.route('/full_diagnostic')
 def full_diagnostic():
     """Complete diagnostic of the AS3935 sensor and GPIO"""
@@ -951,29 +1570,31 @@ def full_diagnostic():
         "timestamp": datetime.now().isoformat(),
         "config": {
             "irq_pin": sensor.irq_pin,
-            "indoor": get_config_boolean('SENSOR', 'indoor', True),
-            "sensitivity": CONFIG.get('SENSOR', 'sensitivity', fallback='high'),
+            "indoor": sensor.cfg.indoor,
+            "sensitivity": sensor.cfg.sensitivity,
             "irq_active_high": getattr(sensor, "active_high", True)
         }
     }
 
     try:
-        # 1. Test GPIO pin state
-        pull_up = not sensor.active_high
-        pressed = sensor.irq_button.is_pressed
-        if pull_up:
-            gpio_state = "LOW" if pressed else "HIGH"
-            expected_idle = "HIGH when idle (active_low IRQ)"
+        # 1. Test GPIO pin state (skipped if the pin was never opened or is closed)
+        if _gpio_available(sensor):
+            pull_up = not sensor.active_high
+            pressed = sensor.irq_button.is_pressed
+            if pull_up:
+                gpio_state = "LOW" if pressed else "HIGH"
+                expected_idle = "HIGH when idle (active_low IRQ)"
+            else:
+                gpio_state = "HIGH" if pressed else "LOW"
+                expected_idle = "LOW when idle (active_high IRQ)"
+            results["gpio_state"] = gpio_state
+            results["gpio_expected"] = expected_idle
         else:
-            gpio_state = "HIGH" if pressed else "LOW"
-            expected_idle = "LOW when idle (active_high IRQ)"
-        results["gpio_state"] = gpio_state
-        results["gpio_expected"] = expected_idle
+            results["gpio_state"] = "unavailable"
 
-        # 2. Read ALL registers
+        # 2. Read ALL registers (one burst read)
         registers = {}
-        for addr in range(0x00, 0x09):
-            val = sensor._read_register(addr)
+        for addr, val in enumerate(sensor._read_registers(0x00, 9)):
             registers[f"0x{addr:02X}"] = {
                 "hex": f"0x{val:02X}",
                 "bin": f"0b{val:08b}"
@@ -1015,8 +1636,7 @@ def full_diagnostic():
         sensor._write_register(0x01, original_nf)
 
         # Clear interrupts
-        for _ in range(5):
-            sensor._read_register(0x03)
+        sensor.clear_interrupts()
 
         results["status"] = "Diagnostic complete"
         return jsonify(results)
@@ -1035,8 +1655,7 @@ def force_trigger():
         app.logger.warning("=== FORCING TEST TRIGGER ===")
 
         # Save current settings
-        orig_01 = sensor._read_register(0x01)
-        orig_02 = sensor._read_register(0x02)
+        orig_01, orig_02 = sensor._read_registers(0x01, 2)
 
         # Set to absolute maximum sensitivity
         sensor._write_register(0x01, 0x00)  # NF_LEV=0, WDTH=0
@@ -1044,7 +1663,7 @@ def force_trigger():
 
         # Clear MASK_DIST to ensure disturbers show
         reg03 = sensor._read_register(0x03)
-        reg03 = reg03 & ~(1 << 5)
+        reg03 = reg03 & ~sensor.MASK_DIST_BIT
         sensor._write_register(0x03, reg03)
 
         # Generate some SPI noise to trigger disturber
@@ -1059,8 +1678,7 @@ def force_trigger():
         int_val = sensor._read_register(0x03) & 0x0F
 
         # Restore settings
-        sensor._write_register(0x01, orig_01)
-        sensor._write_register(0x02, orig_02)
+        sensor._write_registers(0x01, [orig_01, orig_02])
 
         result = {
             "interrupt_detected": int_val != 0,
@@ -1083,21 +1701,31 @@ def force_trigger():
 
 @app.route('/monitor_interrupts')
 def monitor_interrupts():
-    """Monitor interrupt register in real-time"""
-    if not sensor:
+    """Monitor interrupt register in real-time (streamed as Server-Sent Events)"""
+    dev = sensor  # Bind once: a stop or re-init can clear the global mid-stream
+    if not dev:
         return jsonify({"error": "Sensor not initialized"}), 500
 
-    results = []
-    for i in range(10):
-        int_val = sensor._read_register(0x03) & 0x0F
-        results.append({
-            "iteration": i,
-            "interrupt": f"0x{int_val:02X}",
-            "decoded": decode_interrupt(int_val)
-        })
-        time.sleep(0.5)
+    def generate():
+        # App shutdown ends the stream early; stopping monitoring must not,
+        # since that is when this diagnostic is most useful
+        for i in range(10):
+            try:
+                int_val = dev._read_register(0x03) & 0x0F
+            except IOError as e:  # Sensor torn down while streaming
+                yield b"data: " + json_dumps_bytes({"iteration": i, "error": str(e)}) + b"\n\n"
+                return
+            sample = {
+                "iteration": i,
+                "interrupt": f"0x{int_val:02X}",
+                "decoded": decode_interrupt(int_val)
+            }
+            yield b"data: " + json_dumps_bytes(sample) + b"\n\n"
+            if SHUTDOWN_EVENT.wait(0.5):
+                return
 
-    return jsonify(results)
+    return Response(stream_with_context(generate()), mimetype='text/event-stream',
+                    headers={'Cache-Control': 'no-cache'})
 
 @app.route('/test_piezo')
 def test_piezo():
@@ -1109,13 +1737,10 @@ def test_piezo():
         app.logger.warning("=== PIEZO TEST MODE (moderate sensitivity) ===")
 
         # Save current settings
-        orig_00 = sensor._read_register(0x00)
-        orig_01 = sensor._read_register(0x01)
-        orig_02 = sensor._read_register(0x02)
-        orig_03 = sensor._read_register(0x03)
+        orig_regs = sensor._read_registers(0x00, 4)
 
         # 1) Use OUTDOOR AFE (lower gain) during the test
-        sensor._write_register(0x00, 0b00011100)
+        sensor._write_register(0x00, sensor.AFE_OUTDOOR)
         time.sleep(0.002)
 
         # 2) Moderate sensitivity: NF_LEV=0x02, WDTH=0x02
@@ -1128,51 +1753,58 @@ def test_piezo():
 
         # 4) Ensure MASK_DIST is cleared but preserve other bits
         reg03 = sensor._read_register(0x03)
-        reg03 &= ~(1 << 5)  # clear MASK_DIST
+        reg03 &= ~sensor.MASK_DIST_BIT
         sensor._write_register(0x03, reg03)
         time.sleep(0.002)
 
-        # 5) Aggressively clear any pending interrupts
-        for _ in range(6):
-            _ = sensor._read_register(0x03)
-            time.sleep(0.002)
+        # 5) Clear any pending interrupt
+        sensor.clear_interrupts()
 
         app.logger.warning("Ready: click piezo within 5–10 cm of the board for 12 seconds")
 
         results = {"test_duration": "12 seconds", "detections": []}
 
-        # Poll faster for 12 seconds
-        for i in range(120):
-            int_val = sensor._read_register(0x03) & 0x0F
-            if int_val:
-                det = {
-                    "time": f"{i*0.1:.1f}s",
-                    "interrupt": f"0x{int_val:02X}",
-                    "type": []
-                }
-                if int_val & 0x08:
-                    det["type"].append("LIGHTNING!")
-                    dist = sensor.get_lightning_distance()
-                    energy = sensor.get_lightning_energy()
-                    det["distance_km"] = dist
-                    det["energy"] = energy
-                if int_val & 0x04:
-                    det["type"].append("Disturber")
-                if int_val & 0x01:
-                    det["type"].append("Noise")
-
-                results["detections"].append(det)
-
-                # Clear latched INT
-                _ = sensor._read_register(0x03)
+        # Capture IRQ edges for 12 seconds instead of polling the INT register.
+        # The monitoring callback is swapped out for the duration of the test.
+        events = SimpleQueue()
 
-            time.sleep(0.1)
+        def capture_interrupt(_pin):
+            time.sleep(0.002)  # INT register is valid 2 ms after IRQ goes high
+            events.put((time.monotonic(),) + sensor.get_interrupt_data())
+
+        previous_callback = sensor.interrupt_callback
+        sensor.set_interrupt_callback(capture_interrupt)
+        started = time.monotonic()
+        try:
+            time.sleep(12)
+        finally:
+            if previous_callback:
+                sensor.set_interrupt_callback(previous_callback)
+            else:
+                sensor.remove_interrupt_callback()
+
+        while not events.empty():
+            ts, int_val, dist, energy = events.get()
+            if not int_val:
+                continue
+            det = {
+                "time": f"{ts - started:.1f}s",
+                "interrupt": f"0x{int_val:02X}",
+                "type": []
+            }
+            if int_val & 0x08:
+                det["type"].append("LIGHTNING!")
+                det["distance_km"] = dist
+                det["energy"] = energy
+            if int_val & 0x04:
+                det["type"].append("Disturber")
+            if int_val & 0x01:
+                det["type"].append("Noise")
+
+            results["detections"].append(det)
 
         # Restore original registers
-        sensor._write_register(0x00, orig_00)
-        sensor._write_register(0x01, orig_01)
-        sensor._write_register(0x02, orig_02)
-        sensor._write_register(0x03, orig_03)
+        sensor._write_registers(0x00, orig_regs)
 
         app.logger.warning(f"=== PIEZO TEST COMPLETE: {len(results['detections'])} detections ===")
         return jsonify(results)
@@ -1180,106 +1812,113 @@ def test_piezo():
     except Exception as e:
         return jsonify({"error": str(e)}), 500
 
-def handle_lightning_event():
+# Slack message prefix per alert level; the formatted distance is appended
+ALERT_MESSAGES = {
+    AlertLevel.CRITICAL: "🚨 CRITICAL: Lightning strike detected! Distance: ",
+    AlertLevel.WARNING: "⚠️ WARNING: Lightning detected. Distance: ",
+}
+
+def handle_lightning_event(now=None, distance_km=None, energy=None):
     """
     Process a lightning detection event
 
     This function reads the distance and energy values, checks alert
     conditions, logs the event, and sends notifications if needed.
+
+    Args:
+        now: Epoch timestamp of the interrupt (defaults to the current time)
+        distance_km: Distance already read with the interrupt (read now if None)
+        energy: Energy already read with the interrupt (read now if None)
     """
+    if now is None:
+        now = time.time()
+
     try:
-        # Read lightning parameters
-        distance_km = sensor.get_lightning_distance()
-        energy = sensor.get_lightning_energy()
+        # Read lightning parameters (single SPI burst) unless already captured
+        if distance_km is None or energy is None:
+            distance_km, energy = sensor.get_lightning_data()
+
+        # Validate readings before doing any formatting work
+        if distance_km == 0:  # Invalid reading
+            app.logger.warning("Lightning detected with invalid distance (0)")
+            return
 
         # Get unit preference
         use_imperial = get_distance_unit()
 
-        # Validate readings
         if distance_km == 0x3F:  # Out of range indicator
             max_dist = format_distance(63, use_imperial)
-            app.logger.warning(f"Lightning detected but out of range (>{max_dist}), energy: {energy}")
-            return
-
-        if distance_km == 0:  # Invalid reading
-            app.logger.warning("Lightning detected with invalid distance (0)")
+            app.logger.warning("Lightning detected but out of range (>%s), energy: %d", max_dist, energy)
             return
 
         # Check if this event should trigger alerts
-        alert_result = check_alert_conditions(distance_km, energy)
-
-        # Create event record with both units
-        event = {
-            'timestamp': datetime.now().isoformat(),
-            'distance_km': distance_km,
-            'distance_display': format_distance(distance_km, use_imperial),
-            'energy': energy,
-            'energy_formatted': f"{energy:,}",
-            'alert_sent': alert_result.get('send_alert', False),
-            'alert_level': alert_result.get('level').value if alert_result.get('level') else None
-        }
+        alert_result = check_alert_conditions(distance_km, energy, now)
 
-        # Store event in circular buffer
-        with MONITORING_STATE['lock']:
-            MONITORING_STATE['events'].append(event)
-            MONITORING_STATE['status']['sensor_healthy'] = True
+        send_alert = alert_result['send_alert']
+        level = alert_result['level']
+
+        # Store event in circular buffer (lock-free single-writer publish;
+        # display fields are formatted at render time)
+        MONITORING_STATE['events'].push(now, distance_km, energy, send_alert, level)
+        if not MONITORING_STATE['status']['sensor_healthy']:
+            update_status(sensor_healthy=True)
 
         # Log with appropriate units
         distance_str = format_distance(distance_km, use_imperial)
-        app.logger.info(f"⚡ Lightning detected: {distance_str}, energy: {energy}")
+        app.logger.info("⚡ Lightning detected: %s, energy: %d", distance_str, energy)
 
         # Send alerts if needed
-        if alert_result.get('send_alert'):
-            level = alert_result.get('level')
-            if level == AlertLevel.CRITICAL:
-                send_slack_notification(
-                    f"🚨 CRITICAL: Lightning strike detected! Distance: {distance_str}",
-                    distance_km, energy, level
-                )
-            elif level == AlertLevel.WARNING:
-                send_slack_notification(
-                    f"⚠️ WARNING: Lightning detected. Distance: {distance_str}",
-                    distance_km, energy, level
-                )
+        if send_alert:
+            send_slack_notification(ALERT_MESSAGES[level] + distance_str, distance_km, energy, level)
 
     except Exception as e:
         app.logger.error(f"Error handling lightning event: {e}")
         raise
 
 # --- Alert System Functions ---
-def check_alert_conditions(distance_km, energy):
+# Shared, read-only results of check_alert_conditions (one per outcome)
+ALERT_RESULTS = {
+    None: {"send_alert": False, "level": None},
+    AlertLevel.WARNING: {"send_alert": True, "level": AlertLevel.WARNING},
+    AlertLevel.CRITICAL: {"send_alert": True, "level": AlertLevel.CRITICAL},
+}
+
+def check_alert_conditions(distance_km, energy, now):
     """
     Determine if a lightning event should trigger alerts
 
     Args:
         distance_km: Distance to strike in kilometers
         energy: Energy level of strike
+        now: Epoch timestamp of the strike
 
     Returns:
         Dictionary with 'send_alert' boolean and 'level' AlertLevel enum
+        (shared entry from ALERT_RESULTS; do not modify)
     """
-    with ALERT_STATE["timer_lock"]:
-        now = datetime.now()
-        should_send_alert = False
-        alert_level = None
+    # One snapshot for the whole decision, even if the config is reloaded
+    cfg = RUNTIME_CFG
+
+    # Check energy threshold (weak strikes never touch the alert state)
+    if energy < cfg.energy_threshold:
+        return ALERT_RESULTS[None]
 
-        # Check energy threshold
-        energy_threshold = get_config_int('ALERTS', 'energy_threshold', 100000)
-        if energy < energy_threshold:
-            return {"send_alert": False, "level": None}
+    # Get configured distances (stored in km in config)
+    critical_distance_km = cfg.critical_distance
+    warning_distance_km = cfg.warning_distance
 
-        # Get configured distances (stored in km in config)
-        critical_distance_km = get_config_int('ALERTS', 'critical_distance', 10)
-        warning_distance_km = get_config_int('ALERTS', 'warning_distance', 30)
+    with ALERT_STATE["timer_lock"]:
+        alert_level = None
+        mono_now = time.monotonic()
 
         # Check for critical alert
         if distance_km <= critical_distance_km:
             ALERT_STATE["last_critical_strike"] = now
+            ALERT_STATE["last_critical_strike_mono"] = mono_now
 
             # Send alert if this is the first critical strike
             if not ALERT_STATE["critical_active"]:
                 ALERT_STATE["critical_active"] = True
-                should_send_alert = True
                 alert_level = AlertLevel.CRITICAL
 
                 # Cancel warning state if active
@@ -1291,26 +1930,28 @@ def check_alert_conditions(distance_km, energy):
         # Check for warning alert (only if not in critical zone)
         elif distance_km <= warning_distance_km and not ALERT_STATE["critical_active"]:
             ALERT_STATE["last_warning_strike"] = now
+            ALERT_STATE["last_warning_strike_mono"] = mono_now
 
             # Send alert if this is the first warning strike
             if not ALERT_STATE["warning_active"]:
                 ALERT_STATE["warning_active"] = True
-                should_send_alert = True
                 alert_level = AlertLevel.WARNING
 
             # Reset or start all-clear timer
             schedule_all_clear_message(AlertLevel.WARNING)
 
-        return {"send_alert": should_send_alert, "level": alert_level}
+        return ALERT_RESULTS[alert_level]
 
 def schedule_all_clear_message(alert_level):
     """
     Schedule an all-clear message after no activity for configured time
 
+    The caller must hold ALERT_STATE["timer_lock"].
+
     Args:
         alert_level: AlertLevel enum indicating which zone to monitor
     """
-    delay_minutes = get_config_int('ALERTS', 'all_clear_timer', 15)
+    delay_minutes = RUNTIME_CFG.all_clear_timer
     use_imperial = get_distance_unit()
 
     def send_all_clear():
@@ -1320,14 +1961,16 @@ def schedule_all_clear_message(alert_level):
             return
 
         with ALERT_STATE["timer_lock"]:
-            now = datetime.now()
+            # Monotonic clock: immune to NTP steps and DST changes
+            now = time.monotonic()
+            delay_seconds = delay_minutes * 60
 
             # Handle warning zone all-clear
             if alert_level == AlertLevel.WARNING and ALERT_STATE["warning_active"]:
                 # Verify enough time has passed since last strike
-                if ALERT_STATE["warning_timer"] and ALERT_STATE["last_warning_strike"]:
-                    if (now - ALERT_STATE["last_warning_strike"]) >= timedelta(minutes=delay_minutes):
-                        warning_dist_km = get_config_int('ALERTS', 'warning_distance', 30)
+                if ALERT_STATE["warning_timer"] and ALERT_STATE["last_warning_strike_mono"] is not None:
+                    if (now - ALERT_STATE["last_warning_strike_mono"]) >= delay_seconds:
+                        warning_dist_km = RUNTIME_CFG.warning_distance
                         warning_dist_str = format_distance(warning_dist_km, use_imperial)
                         send_slack_notification(
                             f"🟢 All Clear: No lightning detected within "
@@ -1340,9 +1983,9 @@ def schedule_all_clear_message(alert_level):
 
             # Handle critical zone all-clear
             elif alert_level == AlertLevel.CRITICAL and ALERT_STATE["critical_active"]:
-                if ALERT_STATE["critical_timer"] and ALERT_STATE["last_critical_strike"]:
-                    if (now - ALERT_STATE["last_critical_strike"]) >= timedelta(minutes=delay_minutes):
-                        critical_dist_km = get_config_int('ALERTS', 'critical_distance', 10)
+                if ALERT_STATE["critical_timer"] and ALERT_STATE["last_critical_strike_mono"] is not None:
+                    if (now - ALERT_STATE["last_critical_strike_mono"]) >= delay_seconds:
+                        critical_dist_km = RUNTIME_CFG.critical_distance
                         critical_dist_str = format_distance(critical_dist_km, use_imperial)
                         send_slack_notification(
                             f"🟢 All Clear: No lightning detected within "
@@ -1353,33 +1996,20 @@ def schedule_all_clear_message(alert_level):
                         ALERT_STATE["critical_active"] = False
                         ALERT_STATE["critical_timer"] = None
 
-    # Cancel existing timer if present
-    with ALERT_STATE["timer_lock"]:
-        if alert_level == AlertLevel.WARNING and ALERT_STATE["warning_timer"]:
-            ALERT_STATE["warning_timer"].cancel()
-        elif alert_level == AlertLevel.CRITICAL and ALERT_STATE["critical_timer"]:
-            ALERT_STATE["critical_timer"].cancel()
-
-        # Clean up dead timers from tracking list
-        ALERT_STATE["active_timers"] = [t for t in ALERT_STATE["active_timers"] if t.is_alive()]
-
-        # Create and start new timer
-        timer = threading.Timer(delay_minutes * 60, send_all_clear)
-        timer.daemon = True
-        timer.start()
+    # Cancel existing timer if present (a flag flip; the heap entry is dropped lazily)
+    if alert_level == AlertLevel.WARNING and ALERT_STATE["warning_timer"]:
+        ALERT_STATE["warning_timer"].cancel()
+    elif alert_level == AlertLevel.CRITICAL and ALERT_STATE["critical_timer"]:
+        ALERT_STATE["critical_timer"].cancel()
 
-        # Track new timer
-        ALERT_STATE["active_timers"].append(timer)
+    # Queue the all-clear check on the shared scheduler thread
+    timer = ALERT_SCHEDULER.schedule(delay_minutes * 60, send_all_clear)
 
-        # Log if too many timers
-        if len(ALERT_STATE['active_timers']) > 10:
-            app.logger.warning(f"High number of active timers: {len(ALERT_STATE['active_timers'])}")
-
-        # Store timer reference
-        if alert_level == AlertLevel.WARNING:
-            ALERT_STATE["warning_timer"] = timer
-        elif alert_level == AlertLevel.CRITICAL:
-            ALERT_STATE["critical_timer"] = timer
+    # Store timer reference
+    if alert_level == AlertLevel.WARNING:
+        ALERT_STATE["warning_timer"] = timer
+    elif alert_level == AlertLevel.CRITICAL:
+        ALERT_STATE["critical_timer"] = timer
 
 def cleanup_alert_timers():
     """Cancel all active alert timers during shutdown"""
@@ -1394,12 +2024,6 @@ def cleanup_alert_timers():
             ALERT_STATE["critical_timer"].cancel()
             ALERT_STATE["critical_timer"] = None
 
-        # Cancel all tracked timers
-        for timer in ALERT_STATE["active_timers"]:
-            if timer.is_alive():
-                timer.cancel()
-        ALERT_STATE["active_timers"].clear()
-
         # Reset alert states
         ALERT_STATE["warning_active"] = False
         ALERT_STATE["critical_active"] = False
@@ -1407,37 +2031,114 @@ def cleanup_alert_timers():
     app.logger.info("Alert timers cleaned up")
 
 # --- Slack Notification System ---
+# Per-level Slack styling: (attachment color, emoji, urgency label, main text template)
+SLACK_STYLES = {
+    AlertLevel.CRITICAL: ("#ff0000", ":rotating_light:", "CRITICAL",
+                          ":rotating_light: *CRITICAL LIGHTNING ALERT* :rotating_light:\n{}"),
+    AlertLevel.WARNING: ("#ff9900", ":warning:", "WARNING",
+                         ":warning: *WARNING LIGHTNING ALERT* :warning:\n{}"),
+    AlertLevel.ALL_CLEAR: ("#00ff00", ":white_check_mark:", "ALL CLEAR",
+                           ":white_check_mark: *ALL CLEAR*\n{}"),
+}
+SLACK_DEFAULT_STYLE = ("#ffcc00", ":zap:", "INFO", ":zap: {}")
+
+# Static context blocks for strike alerts, built once instead of per notification
+SLACK_CONTEXT_BLOCKS = {
+    AlertLevel.CRITICAL: {
+        "type": "context",
+        "elements": [{"type": "mrkdwn", "text": ":exclamation: *Very close strike. Take shelter immediately.*"}]
+    },
+    AlertLevel.WARNING: {
+        "type": "context",
+        "elements": [{"type": "mrkdwn", "text": ":cloud_with_lightning: *Lightning activity in the area. Be prepared.*"}]
+    }
+}
+
+@functools.lru_cache(maxsize=8)
+def _all_clear_context_block(warning_zone, minutes):
+    """Context block for an all-clear message, built once per zone and timer value"""
+    zone = "warning" if warning_zone else "critical"
+    return {
+        "type": "context",
+        "elements": [{
+            "type": "mrkdwn",
+            "text": f":information_source: No strikes in {zone} zone for {minutes} min."
+        }]
+    }
+
+# Persistent HTTP session so consecutive alerts reuse the keep-alive TLS connection.
+# Rate limiting (429) and gateway errors are retried with backoff at the
+# transport level, honoring Slack's Retry-After header.
+SLACK_SESSION = requests.Session()
+SLACK_SESSION.headers['Content-Type'] = 'application/json'
+SLACK_SESSION.mount('https://', requests.adapters.HTTPAdapter(
+    pool_connections=1,
+    pool_maxsize=4,
+    max_retries=Retry(
+        total=2,
+        backoff_factor=0.3,
+        status_forcelist=[429, 502, 503, 504],
+        allowed_methods=frozenset(['POST']),
+        raise_on_status=False
+    )
+))
+SLACK_TIMEOUT = (3.05, 10)  # (connect, read) seconds
+SLACK_MIN_INTERVAL = 1.0    # Seconds between posts (Slack allows ~1 message/s per channel)
+
 def slack_worker():
     """
     Background worker thread for sending Slack notifications
 
     This runs continuously, pulling messages from the queue and sending them.
     This design prevents Slack API calls from blocking the interrupt handler.
+    Posts are paced at most one per SLACK_MIN_INTERVAL to stay under Slack's
+    rate limit; pacing is skipped while draining for shutdown.
     """
-    while True:
-        try:
-            # Block for up to 1 second waiting for a message
-            message_data = SLACK_QUEUE.get(timeout=1)
+    last_post = float('-inf')
 
-            if message_data is None:  # Shutdown signal
+    while True:
+        # Sleep until a message is queued or shutdown is requested (no idle
+        # wakeups; cleanup_resources sets SLACK_STOP and then SLACK_EVENT)
+        SLACK_EVENT.wait()
+        SLACK_EVENT.clear()
+
+        # Drain everything queued (including anything added after the clear)
+        while True:
+            message_data = _next_slack_message()
+            if message_data is None:
                 break
 
-            # Attempt to send with retries
-            for attempt in range(3):
-                try:
-                    _send_slack_notification_internal(**message_data)
-                    break
-                except Exception as e:
-                    if attempt == 2:
-                        app.logger.error(f"Failed to send Slack notification after 3 attempts: {e}")
-                    else:
-                        time.sleep(1)  # Brief delay before retry
+            # Pace posts; SLACK_STOP cuts the wait short at shutdown
+            wait = last_post + SLACK_MIN_INTERVAL - time.monotonic()
+            if wait > 0:
+                SLACK_STOP.wait(wait)
+            last_post = time.monotonic()
 
-        except Empty:
-            # No messages in queue, continue waiting
-            continue
-        except Exception as e:
-            app.logger.error(f"Slack worker error: {e}")
+            try:
+                # Attempt to send with retries
+                for attempt in range(3):
+                    try:
+                        _send_slack_notification_internal(**message_data)
+                        break
+                    except Exception as e:
+                        if attempt == 2:
+                            app.logger.error(f"Failed to send Slack notification after 3 attempts: {e}")
+                        else:
+                            time.sleep(1)  # Brief delay before retry
+            except Exception as e:
+                app.logger.error(f"Slack worker error: {e}")
+
+        if SLACK_STOP.is_set():  # Shutdown signal (queue already drained)
+            break
+
+def _next_slack_message():
+    """Pop the oldest queued Slack message across both queues (None if empty)"""
+    with SLACK_QUEUE_LOCK:
+        if SLACK_URGENT_QUEUE and (not SLACK_QUEUE or SLACK_URGENT_QUEUE[0][0] < SLACK_QUEUE[0][0]):
+            return SLACK_URGENT_QUEUE.popleft()[1]
+        if SLACK_QUEUE:
+            return SLACK_QUEUE.popleft()[1]
+    return None
 
 def send_slack_notification(message, distance_km=None, energy=None, alert_level=None, previous_level=None):
     """
@@ -1452,9 +2153,14 @@ def send_slack_notification(message, distance_km=None, energy=None, alert_level=
         energy: Energy level of strike (optional)
         alert_level: AlertLevel enum for notification type
         previous_level: Previous AlertLevel for all-clear messages
+
+    Returns:
+        True if the message was queued, False if it was not (Slack disabled
+        or unconfigured, duplicate suppressed, or queue full)
     """
-    if not get_config_boolean('SLACK', 'enabled', False):
-        return
+    cfg = RUNTIME_CFG
+    if not cfg.slack_enabled or not cfg.slack_configured:
+        return False
 
     msg_data = {
         'message': message,
@@ -1465,41 +2171,39 @@ def send_slack_notification(message, distance_km=None, energy=None, alert_level=
         'timestamp': time.time()  # Add timestamp for queue management
     }
 
-    try:
-        SLACK_QUEUE.put_nowait(msg_data)
-    except:
-        # Queue full - handle based on priority
-        if alert_level in [AlertLevel.CRITICAL, AlertLevel.WARNING]:
-            # For critical messages, force space by removing oldest
-            try:
-                # Find and remove oldest non-critical message
-                temp_queue = []
-                removed = False
-
-                while not SLACK_QUEUE.empty():
-                    try:
-                        item = SLACK_QUEUE.get_nowait()
-                        if not removed and item.get('alert_level') not in [AlertLevel.CRITICAL, AlertLevel.WARNING]:
-                            removed = True
-                            app.logger.warning(f"Removed non-critical message to make space for {alert_level.value}")
-                        else:
-                            temp_queue.append(item)
-                    except Empty:
-                        break
+    urgent = alert_level in (AlertLevel.CRITICAL, AlertLevel.WARNING)
+    dedup_key = (alert_level, previous_level, message)
+    now = time.monotonic()
 
-                # Put items back
-                for item in temp_queue:
-                    SLACK_QUEUE.put_nowait(item)
+    with SLACK_QUEUE_LOCK:
+        # Drop an exact repeat of the last queued notification within the
+        # window. Only the last one is compared, so a change of level in
+        # between (e.g. critical -> all-clear -> critical) is always sent.
+        if dedup_key == SLACK_LAST_QUEUED[0] and now - SLACK_LAST_QUEUED[1] < SLACK_DEDUP_WINDOW:
+            app.logger.debug("Suppressed duplicate Slack notification")
+            return False
 
-                # Try to add critical message again
-                if removed:
-                    SLACK_QUEUE.put_nowait(msg_data)
-                else:
-                    app.logger.error("Failed to queue critical Slack notification - queue full of critical messages")
-            except:
-                app.logger.error("Failed to manage Slack queue for critical message")
+        if len(SLACK_URGENT_QUEUE) + len(SLACK_QUEUE) >= SLACK_QUEUE_MAX:
+            if not urgent:
+                app.logger.warning("Slack queue full, dropping non-critical notification")
+                return False
+            if not SLACK_QUEUE:
+                app.logger.error("Failed to queue critical Slack notification - queue full of critical messages")
+                return False
+            # Queue full - make space by removing the oldest non-critical message
+            SLACK_QUEUE.popleft()
+            app.logger.warning(f"Removed non-critical message to make space for {alert_level.value}")
+
+        entry = (next(SLACK_QUEUE_SEQ), msg_data)
+        SLACK_LAST_QUEUED[0] = dedup_key
+        SLACK_LAST_QUEUED[1] = now
+        if urgent:
+            SLACK_URGENT_QUEUE.append(entry)
         else:
-            app.logger.warning("Slack queue full, dropping non-critical notification")
+            SLACK_QUEUE.append(entry)
+
+    SLACK_EVENT.set()
+    return True
 
 def _send_slack_notification_internal(message, distance_km=None, energy=None, alert_level=None, previous_level=None, timestamp=None):
     """
@@ -1507,8 +2211,8 @@ def _send_slack_notification_internal(message, distance_km=None, energy=None, al
 
     This is called by the worker thread and handles the actual API communication.
     """
-    bot_token = CONFIG.get('SLACK', 'bot_token', fallback='')
-    channel = CONFIG.get('SLACK', 'channel', fallback='#alerts')
+    bot_token = get_config_str('SLACK', 'bot_token', '')
+    channel = get_config_str('SLACK', 'channel', '#alerts')
 
     if not bot_token:
         app.logger.warning("Slack is enabled, but Bot Token is not configured")
@@ -1520,28 +2224,15 @@ def _send_slack_notification_internal(message, distance_km=None, energy=None, al
     use_imperial = get_distance_unit()
 
     # Determine notification styling based on alert level
-    if alert_level == AlertLevel.CRITICAL:
-        color, emoji, urgency = "#ff0000", ":rotating_light:", "CRITICAL"
-    elif alert_level == AlertLevel.WARNING:
-        color, emoji, urgency = "#ff9900", ":warning:", "WARNING"
-    elif alert_level == AlertLevel.ALL_CLEAR:
-        color, emoji, urgency = "#00ff00", ":white_check_mark:", "ALL CLEAR"
-    else:
-        color, emoji, urgency = "#ffcc00", ":zap:", "INFO"
-
-    # Build Slack message blocks
-    blocks = []
-
-    # Main message block
-    if alert_level in [AlertLevel.WARNING, AlertLevel.CRITICAL]:
-        blocks.append({
-            "type": "section",
-            "text": {
-                "type": "mrkdwn",
-                "text": f"{emoji} *{urgency} LIGHTNING ALERT* {emoji}\n{message}"
-            }
-        })
+    color, emoji, urgency, main_text = SLACK_STYLES.get(alert_level, SLACK_DEFAULT_STYLE)
+
+    # Build Slack message blocks, starting with the main message
+    blocks = [{
+        "type": "section",
+        "text": {"type": "mrkdwn", "text": main_text.format(message)}
+    }]
 
+    if alert_level in (AlertLevel.WARNING, AlertLevel.CRITICAL):
         # Add details if available
         if distance_km is not None and energy is not None:
             distance_str = format_distance(distance_km, use_imperial)
@@ -1555,39 +2246,13 @@ def _send_slack_notification_internal(message, distance_km=None, energy=None, al
                 ]
             })
 
-        # Add context message
-        if alert_level == AlertLevel.CRITICAL:
-            context_text = ":exclamation: *Very close strike. Take shelter immediately.*"
-        else:
-            context_text = ":cloud_with_lightning: *Lightning activity in the area. Be prepared.*"
-
-        blocks.append({
-            "type": "context",
-            "elements": [{"type": "mrkdwn", "text": context_text}]
-        })
+        # Add context message (shared template, never mutated)
+        blocks.append(SLACK_CONTEXT_BLOCKS[alert_level])
 
     elif alert_level == AlertLevel.ALL_CLEAR:
-        blocks.append({
-            "type": "section",
-            "text": {"type": "mrkdwn", "text": f"{emoji} *{urgency}*\n{message}"}
-        })
-
-        # Add context about which zone cleared
-        previous_urgency = "WARNING" if previous_level == AlertLevel.WARNING else "CRITICAL"
-        blocks.append({
-            "type": "context",
-            "elements": [{
-                "type": "mrkdwn",
-                "text": f":information_source: No strikes in {previous_urgency.lower()} zone for "
-                        f"{get_config_int('ALERTS', 'all_clear_timer', 15)} min."
-            }]
-        })
-    else:
-        # Generic message
-        blocks.append({
-            "type": "section",
-            "text": {"type": "mrkdwn", "text": f"{emoji} {message}"}
-        })
+        # Add context about which zone cleared (shared template, never mutated)
+        blocks.append(_all_clear_context_block(previous_level == AlertLevel.WARNING,
+                                               RUNTIME_CFG.all_clear_timer))
 
     # Build payload
     payload = {
@@ -1598,29 +2263,27 @@ def _send_slack_notification_internal(message, distance_km=None, energy=None, al
     }
 
     # Add color attachment for critical alerts
-    if alert_level in [AlertLevel.CRITICAL, AlertLevel.WARNING, AlertLevel.ALL_CLEAR]:
+    if alert_level in SLACK_STYLES:
         payload['attachments'] = [{'color': color, 'fallback': message}]
 
-    headers = {
-        'Authorization': f'Bearer {bot_token}',
-        'Content-Type': 'application/json'
-    }
+    # Token is set per call since it can change on config reload
+    headers = {'Authorization': f'Bearer {bot_token}'}
 
     # Send to Slack API
     try:
-        response = requests.post(url, json=payload, headers=headers, timeout=10)
+        response = SLACK_SESSION.post(url, data=json_dumps_bytes(payload), headers=headers, timeout=SLACK_TIMEOUT)
         response.raise_for_status()
 
         result = response.json()
         if not result.get('ok'):
             app.logger.error(f"Slack API error: {result.get('error', 'Unknown error')}")
 
-    except requests.exceptions.Timeout:
-        app.logger.warning("Slack notification timed out - continuing operation")
-    except requests.exceptions.RequestException as e:
-        app.logger.error(f"Slack notification failed: {e}")
     except Exception as e:
-        app.logger.error(f"Unexpected error sending Slack notification: {e}")
+        # Transient HTTP failures were already retried by SLACK_SESSION's adapter
+        if isinstance(e, requests.exceptions.Timeout):
+            app.logger.warning("Slack notification timed out - continuing operation")
+        else:
+            app.logger.error(f"Slack notification failed: {e}")
 
 # --- Dynamic Noise Handling ---
 def handle_disturber_event():
@@ -1630,33 +2293,37 @@ def handle_disturber_event():
     If too many disturbers are detected within a time window, the noise
     floor is raised to reduce sensitivity.
     """
-    if not get_config_boolean('NOISE_HANDLING', 'enabled', False):
+    cfg = RUNTIME_CFG
+    if not cfg.noise_handling:
         return
 
-    now = datetime.now()
-    threshold = get_config_int('NOISE_HANDLING', 'event_threshold', 15)
-    window = timedelta(seconds=get_config_int('NOISE_HANDLING', 'time_window_seconds', 120))
-    revert_delay = get_config_int('NOISE_HANDLING', 'revert_delay_minutes', 10) * 60
+    now = time.monotonic()
+    threshold = cfg.noise_event_threshold
+    window = cfg.noise_window_seconds
+    revert_delay = cfg.noise_revert_seconds
 
     with MONITORING_STATE['lock']:
-        # Add this event to the buffer
-        MONITORING_STATE['noise_events'].append(now)
-
-        # Remove events outside the time window
-        while MONITORING_STATE['noise_events'] and (now - MONITORING_STATE['noise_events'][0]) > window:
-            MONITORING_STATE['noise_events'].popleft()
-
-        # Failsafe: prevent buffer from growing too large
-        if len(MONITORING_STATE['noise_events']) > 100:
-            # Keep only the most recent 50 events
-            MONITORING_STATE['noise_events'] = deque(
-                list(MONITORING_STATE['noise_events'])[-50:],
-                maxlen=50
-            )
-            app.logger.warning("Noise events buffer exceeded expected size, truncated")
+        noise_events = MONITORING_STATE['noise_events']
+
+        # Only the newest `threshold` events can matter, so the deque is
+        # bounded by the threshold itself (resized only when it changes).
+        # A threshold below 1 still needs room for the current event.
+        maxlen = max(threshold, 1)
+        if noise_events.maxlen != maxlen:
+            noise_events = deque(noise_events, maxlen=maxlen)
+            MONITORING_STATE['noise_events'] = noise_events
+
+        # Add this event to the buffer (bounded by the deque's maxlen)
+        noise_events.append(now)
+
+        # Timestamps are appended in order, so expired events are always at
+        # the left end: each one is popped exactly once (amortized O(1))
+        cutoff = now - window
+        while noise_events and noise_events[0] < cutoff:
+            noise_events.popleft()
 
         # Check if threshold exceeded
-        if len(MONITORING_STATE['noise_events']) >= threshold and MONITORING_STATE['status']['noise_mode'] != 'Critical':
+        if len(noise_events) >= threshold and MONITORING_STATE['status']['noise_mode'] != 'Critical':
             # Cancel existing revert timer
             if MONITORING_STATE.get('noise_revert_timer'):
                 MONITORING_STATE['noise_revert_timer'].cancel()
@@ -1666,36 +2333,40 @@ def handle_disturber_event():
                 with SENSOR_INIT_LOCK:
                     if sensor and sensor.is_initialized:
                         app.logger.warning(
-                            f"Disturber threshold exceeded ({len(MONITORING_STATE['noise_events'])} events). "
-                            f"Elevating noise floor to High."
+                            "Disturber threshold exceeded (%d events). Elevating noise floor to High.",
+                            len(noise_events)
                         )
-                        sensor.set_noise_floor(get_config_int('NOISE_HANDLING', 'raised_noise_floor_level', 5))
-                        MONITORING_STATE['status']['noise_mode'] = 'High'
+                        sensor.set_noise_floor(cfg.raised_noise_floor_level)
+                        _replace_status(noise_mode='High')
 
             # Schedule reversion to normal
-            timer = threading.Timer(revert_delay, revert_noise_floor, args=['High'])
-            timer.daemon = True
-            timer.start()
-            MONITORING_STATE['noise_revert_timer'] = timer
+            MONITORING_STATE['noise_revert_timer'] = ALERT_SCHEDULER.schedule(
+                revert_delay, revert_noise_floor, 'High')
 
-def handle_noise_high_event():
+def handle_noise_high_event(now=None, distance_km=None, energy=None):
     """
     Handle persistent noise events (INT_NH interrupt)
 
     This indicates the noise level is consistently too high, so we
     immediately set the noise floor to maximum.
+
+    Args:
+        now: Epoch timestamp of the interrupt
+        distance_km: Distance read with the interrupt (read now if None)
+        energy: Energy read with the interrupt (read now if None)
     """
     # For piezo testing, check if there's also a lightning signature
-    distance_km = sensor.get_lightning_distance()
-    energy = sensor.get_lightning_energy()
+    if distance_km is None or energy is None:
+        distance_km, energy = sensor.get_lightning_data()
 
     if distance_km > 0 and distance_km < 0x3F and energy > 0:
-        app.logger.warning(f"Noise event has lightning signature! Distance: {distance_km}km, Energy: {energy}")
+        app.logger.warning("Noise event has lightning signature! Distance: %dkm, Energy: %d", distance_km, energy)
         # Treat as lightning
-        handle_lightning_event()
+        handle_lightning_event(now, distance_km, energy)
         return
 
-    if not get_config_boolean('NOISE_HANDLING', 'enabled', False):
+    cfg = RUNTIME_CFG
+    if not cfg.noise_handling:
         return
 
     with MONITORING_STATE['lock']:
@@ -1712,14 +2383,11 @@ def handle_noise_high_event():
             if sensor and sensor.is_initialized:
                 app.logger.critical("Persistent high noise detected (INT_NH). Elevating noise floor to Critical.")
                 sensor.set_noise_floor(7)  # Maximum noise floor
-                MONITORING_STATE['status']['noise_mode'] = 'Critical'
+                _replace_status(noise_mode='Critical')
 
         # Schedule reversion
-        revert_delay = get_config_int('NOISE_HANDLING', 'revert_delay_minutes', 10) * 60
-        timer = threading.Timer(revert_delay, revert_noise_floor, args=['Critical'])
-        timer.daemon = True
-        timer.start()
-        MONITORING_STATE['noise_revert_timer'] = timer
+        MONITORING_STATE['noise_revert_timer'] = ALERT_SCHEDULER.schedule(
+            cfg.noise_revert_seconds, revert_noise_floor, 'Critical')
 
 def revert_noise_floor(level_to_revert):
     """
@@ -1737,7 +2405,7 @@ def revert_noise_floor(level_to_revert):
                 if current_mode == level_to_revert:
                     app.logger.info(f"Reverting noise floor from {current_mode} to Normal")
                     sensor.set_noise_floor(sensor.original_noise_floor)
-                    MONITORING_STATE['status']['noise_mode'] = 'Normal'
+                    _replace_status(noise_mode='Normal')
                     MONITORING_STATE['noise_events'].clear()
 
                     # Clear timer reference
@@ -1745,6 +2413,32 @@ def revert_noise_floor(level_to_revert):
                         MONITORING_STATE['noise_revert_timer'] = None
 
 # --- Core Monitoring Thread ---
+def apply_realtime_scheduling():
+    """
+    Optionally pin the calling thread to one CPU and give it SCHED_FIFO priority
+
+    Controlled by [SENSOR] realtime_cpu (-1 = no pinning) and
+    realtime_priority (0 = normal scheduling). Needs root or CAP_SYS_NICE;
+    failures are logged and monitoring continues with normal scheduling.
+    """
+    cpu = get_config_int('SENSOR', 'realtime_cpu', -1)
+    priority = get_config_int('SENSOR', 'realtime_priority', 0)
+
+    # On Linux, pid 0 addresses the calling thread only
+    if cpu >= 0:
+        try:
+            os.sched_setaffinity(0, {cpu})
+            app.logger.info(f"Monitoring thread pinned to CPU{cpu}")
+        except (AttributeError, OSError) as e:
+            app.logger.warning(f"Could not pin monitoring thread to CPU{cpu}: {e}")
+
+    if priority > 0:
+        try:
+            os.sched_setscheduler(0, os.SCHED_FIFO, os.sched_param(priority))
+            app.logger.info(f"Monitoring thread running SCHED_FIFO priority {priority}")
+        except (AttributeError, OSError) as e:
+            app.logger.warning(f"Could not set SCHED_FIFO priority {priority}: {e}")
+
 def lightning_monitoring():
     """
     Main monitoring thread with event-driven architecture using gpiozero
@@ -1757,6 +2451,9 @@ def lightning_monitoring():
 
     app.logger.info(f"Starting lightning monitoring thread v2.1-Production-Enhanced-gpiozero-Imperial-FIXED (backend: {GPIO_BACKEND})")
 
+    # Reduce wake-up latency when configured (thread blocks on the IRQ event, so it cannot starve the CPU)
+    apply_realtime_scheduling()
+
     # Initialize sensor with retry logic
     if not initialize_sensor_with_retry():
         app.logger.critical("Failed to initialize sensor after all retries")
@@ -1772,7 +2469,7 @@ def lightning_monitoring():
 
         try:
             # Set up the interrupt callback using gpiozero
-            sensor.set_interrupt_callback(handle_sensor_interrupt)
+            sensor.set_interrupt_callback(on_sensor_irq)
 
             # Verify setup worked
             time.sleep(0.1)
@@ -1797,9 +2494,7 @@ def lightning_monitoring():
 
     if not interrupt_configured:
         app.logger.error(f"Failed to setup gpiozero interrupt after {max_setup_attempts} attempts")
-        with MONITORING_STATE['lock']:
-            MONITORING_STATE['status']['sensor_healthy'] = False
-            MONITORING_STATE['status']['last_error'] = "gpiozero interrupt setup failed"
+        update_status(sensor_healthy=False, last_error="gpiozero interrupt setup failed")
         return
 
     # Main monitoring loop
@@ -1808,18 +2503,22 @@ def lightning_monitoring():
     consecutive_failures = 0
     max_consecutive_failures = 1
 
+    irq_event = MONITORING_STATE['irq_event']
+    irq_event.clear()
+
     try:
         while not MONITORING_STATE['stop_event'].is_set():
-            # Non-blocking wait with frequent checks
-            for _ in range(100):  # Check every 0.1s for 10s total
+            # Sleep until the IRQ edge callback fires (or the timeout elapses)
+            if irq_event.wait(timeout=5):
+                irq_event.clear()
                 if MONITORING_STATE['stop_event'].is_set():
                     break
-                time.sleep(0.1)
+                handle_sensor_interrupt()
 
             # Periodic health check
             current_time = time.time()
             if current_time - last_health_check > health_check_interval:
-                if not perform_sensor_health_check():
+                if not perform_sensor_health_check(force=True):
                     consecutive_failures += 1
                     app.logger.warning(f"Sensor health check failed ({consecutive_failures}/{max_consecutive_failures})")
 
@@ -1840,7 +2539,7 @@ def lightning_monitoring():
 
                             # Re-setup interrupt
                             try:
-                                sensor.set_interrupt_callback(handle_sensor_interrupt)
+                                sensor.set_interrupt_callback(on_sensor_irq)
                                 interrupt_configured = True
                                 app.logger.info("Sensor recovered and gpiozero interrupt re-configured")
                             except Exception as e:
@@ -1857,9 +2556,7 @@ def lightning_monitoring():
 
     except Exception as e:
         app.logger.error(f"Unexpected error in monitoring loop: {e}", exc_info=True)
-        with MONITORING_STATE['lock']:
-            MONITORING_STATE['status']['sensor_healthy'] = False
-            MONITORING_STATE['status']['last_error'] = str(e)
+        update_status(sensor_healthy=False, last_error=str(e))
 
     finally:
         app.logger.info("Cleaning up monitoring thread (gpiozero)")
@@ -1883,9 +2580,7 @@ def lightning_monitoring():
                 sensor = None
 
         # Update status
-        with MONITORING_STATE['lock']:
-            MONITORING_STATE['status']['sensor_active'] = False
-            MONITORING_STATE['status']['status_message'] = "Stopped"
+        update_status(sensor_active=False, status_message="Stopped")
 
         app.logger.info("Monitoring thread cleanup complete (gpiozero)")
 
@@ -1899,91 +2594,94 @@ def monitoring_watchdog():
     """
     consecutive_failures = 0
     max_failures = 3
+    last_irq_count = IRQ_STATS[0]
 
-    while not MONITORING_STATE['stop_event'].is_set():
-        # Wait 60 seconds between checks
-        for _ in range(60):
-            if MONITORING_STATE['stop_event'].is_set():
-                return
-            time.sleep(1)
+    while True:
+        # Wait 60 seconds between checks (single futex wait, wakes on shutdown)
+        if MONITORING_STATE['stop_event'].wait(60):
+            return
 
-        with MONITORING_STATE['lock']:
-            thread = MONITORING_STATE.get('thread')
+        # Interrupt storm check from the lock-free edge counter
+        irq_count = IRQ_STATS[0]
+        storm = (irq_count - last_irq_count) >= IRQ_STORM_PER_MINUTE
+        if storm and not MONITORING_STATE['interrupt_storm_detected']:
+            app.logger.warning(f"Interrupt storm detected: {irq_count - last_irq_count} IRQ edges in the last minute")
+        MONITORING_STATE['interrupt_storm_detected'] = storm
+        last_irq_count = irq_count
 
-            # Check if thread is alive
-            if not thread or not thread.is_alive():
-                # Only restart if auto-start is enabled
-                if not get_config_boolean('SENSOR', 'auto_start', True):
-                    continue
+        # Check if the monitoring thread is alive (reference read is atomic)
+        thread = MONITORING_STATE.get('thread')
+        if thread and thread.is_alive():
+            # Thread is running normally
+            consecutive_failures = 0
+            continue
 
-                consecutive_failures += 1
+        # Only restart if auto-start is enabled
+        if not get_config_boolean('SENSOR', 'auto_start', True):
+            continue
 
-                # Give up after too many failures
-                if consecutive_failures >= max_failures:
-                    app.logger.critical(f"Monitoring thread failed {max_failures} times. Stopping watchdog.")
-                    MONITORING_STATE['status']['status_message'] = "Fatal: Too many failures"
-                    return
+        consecutive_failures += 1
 
-                app.logger.warning(f"Monitoring thread died (failure {consecutive_failures}/{max_failures}). Restarting...")
+        # Give up after too many failures
+        if consecutive_failures >= max_failures:
+            app.logger.critical(f"Monitoring thread failed {max_failures} times. Stopping watchdog.")
+            update_status(status_message="Fatal: Too many failures")
+            return
 
-                # Clear stop event and start new thread
-                MONITORING_STATE['stop_event'].clear()
-                new_thread = threading.Thread(target=lightning_monitoring, daemon=True)
-                MONITORING_STATE['thread'] = new_thread
-                new_thread.start()
+        app.logger.warning(f"Monitoring thread died (failure {consecutive_failures}/{max_failures}). Restarting...")
 
-                # Wait a bit to see if it starts successfully
-                time.sleep(5)
+        with MONITORING_STATE['lock']:
+            # Someone (e.g. /start_monitoring) may have restarted it meanwhile
+            thread = MONITORING_STATE.get('thread')
+            if thread and thread.is_alive():
+                continue
 
-                if new_thread.is_alive():
-                    consecutive_failures = 0  # Reset on success
-                    app.logger.info("Monitoring thread restarted successfully")
-            else:
-                # Thread is running normally
-                consecutive_failures = 0
+            # Clear stop event and start new thread
+            MONITORING_STATE['stop_event'].clear()
+            new_thread = threading.Thread(target=lightning_monitoring, daemon=True)
+            MONITORING_STATE['thread'] = new_thread
+            new_thread.start()
+
+        # Wait a bit to see if it starts successfully (returns early if it
+        # dies); the lock is released so web routes aren't blocked meanwhile
+        new_thread.join(timeout=5)
+
+        if new_thread.is_alive():
+            consecutive_failures = 0  # Reset on success
+            app.logger.info("Monitoring thread restarted successfully")
 
 # --- Flask Web Routes ---
 @app.route('/')
 def index():
     """Main dashboard page"""
-    # Get current state with thread safety
-    with MONITORING_STATE['lock']:
-        events = list(MONITORING_STATE['events'])
-        status = MONITORING_STATE['status'].copy()
-        total_events = len(events)
+    # Get current state lock-free (copy-on-write status, self-copying event ring)
+    ring = MONITORING_STATE['events'].copy()
+    status = status_view()
+
+    # Build dicts for the last 20 events (all the dashboard shows) lock-free
+    events = ring.snapshot(limit=20)
+    total_events = len(ring)
+    events_truncated = total_events >= ring.cap
 
     with ALERT_STATE["timer_lock"]:
         alert_status = {
             'warning_active': ALERT_STATE["warning_active"],
             'critical_active': ALERT_STATE["critical_active"],
-            'last_warning_strike': ALERT_STATE["last_warning_strike"].strftime('%H:%M:%S')
+            'last_warning_strike': time.strftime('%H:%M:%S', time.localtime(ALERT_STATE["last_warning_strike"]))
                 if ALERT_STATE["last_warning_strike"] else None,
-            'last_critical_strike': ALERT_STATE["last_critical_strike"].strftime('%H:%M:%S')
+            'last_critical_strike': time.strftime('%H:%M:%S', time.localtime(ALERT_STATE["last_critical_strike"]))
                 if ALERT_STATE["last_critical_strike"] else None
         }
 
-    # Pre-format event data for template
-    for event in events:
-        if 'timestamp' in event:
-            try:
-                event['timestamp'] = datetime.fromisoformat(event['timestamp']).strftime('%Y-%m-%d %H:%M:%S')
-            except:
-                event['timestamp'] = 'Unknown'
-
-        # Energy is already formatted in the event
-        # Distance is already formatted with units in distance_display
-
-    # Format last reading timestamp
-    if status.get('last_reading'):
-        try:
-            status['last_reading'] = datetime.fromisoformat(status['last_reading']).strftime('%Y-%m-%d %H:%M:%S')
-        except:
-            status['last_reading'] = 'Unknown'
-
     # Get unit preference for display
     use_imperial = get_distance_unit()
     unit_label = "miles" if use_imperial else "km"
 
+    # Pre-format event data for template (timestamps use the fmtts filter)
+    for event in events:
+        event['distance_display'] = format_distance(event['distance_km'], use_imperial)
+        event['energy_formatted'] = f"{event['energy']:,}"
+
     return render_template('index.html',
         lightning_events=events,
         sensor_status=status,
@@ -1991,7 +2689,7 @@ def index():
         config=CONFIG,
         debug_mode=get_config_boolean('SYSTEM', 'debug', False),
         total_event_count=total_events,
-        events_truncated=(total_events >= 100),
+        events_truncated=events_truncated,
         use_imperial=use_imperial,
         unit_label=unit_label
     )
@@ -1999,16 +2697,18 @@ def index():
 @app.route('/api/status')
 def api_status():
     """JSON API endpoint for system status"""
-    with MONITORING_STATE['lock']:
-        status = MONITORING_STATE['status'].copy()
-        thread_alive = MONITORING_STATE['thread'].is_alive() if MONITORING_STATE.get('thread') else False
-        event_count = len(MONITORING_STATE['events'])
+    # Copy-on-write status snapshot and thread reference, no lock needed
+    status = status_view()
+    thread = MONITORING_STATE.get('thread')
 
-    with ALERT_STATE["timer_lock"]:
-        alert_status = {
-            'warning_active': ALERT_STATE["warning_active"],
-            'critical_active': ALERT_STATE["critical_active"]
-        }
+    thread_alive = thread.is_alive() if thread else False
+    event_count = len(MONITORING_STATE['events'])
+
+    # Each flag is a single atomic read; no need to stall the strike path
+    alert_status = {
+        'warning_active': ALERT_STATE["warning_active"],
+        'critical_active': ALERT_STATE["critical_active"]
+    }
 
     return jsonify({
         **status,
@@ -2017,17 +2717,41 @@ def api_status():
         'version': '2.1-Production-Enhanced-gpiozero-Imperial-FIXED',
         'gpio_backend': GPIO_BACKEND,
         'event_count': event_count,
-        'config_valid': validate_config(),
+        'config_valid': RUNTIME_CFG.config_valid,
         'units': 'imperial' if get_distance_unit() else 'metric'
     })
 
+# Last /health response as (monotonic time, JSON body, HTTP status)
+HEALTH_RESPONSE = (float('-inf'), b'', 503)
+
 @app.route('/health')
 def health_check():
     """
     Health check endpoint for monitoring system health
 
+    The response is reused for HEALTH_TTL seconds so frequent probes don't
+    each take the sensor lock for a register read.
+
     Returns HTTP 200 if healthy, 503 if degraded
     """
+    global HEALTH_RESPONSE
+
+    checked_at, body, code = HEALTH_RESPONSE
+    if time.monotonic() - checked_at >= HEALTH_TTL:
+        health = _collect_health()
+        body = json_dumps_bytes(health)
+        code = 200 if health['status'] == 'healthy' else 503
+        HEALTH_RESPONSE = (time.monotonic(), body, code)
+
+    return Response(body, status=code, mimetype='application/json')
+
+def _collect_health():
+    """Run the /health checks and return the result dict"""
+    # Take each shared reference once so every check sees the same objects
+    dev = sensor
+    status = MONITORING_STATE['status']
+    thread = MONITORING_STATE.get('thread')
+
     health = {
         'status': 'healthy',
         'timestamp': datetime.now().isoformat(),
@@ -2037,34 +2761,31 @@ def health_check():
         'checks': {}
     }
 
-    # Check sensor
-    with SENSOR_INIT_LOCK:
-        if sensor and sensor.is_initialized:
-            try:
-                # Try a register read
-                sensor._read_register(0x00)
-                health['checks']['sensor'] = 'ok'
-            except:
-                health['checks']['sensor'] = 'error'
-                health['status'] = 'degraded'
-        else:
-            health['checks']['sensor'] = 'not_initialized'
+    # Check sensor (the read only takes the per-transfer SPI lock)
+    if dev and dev.is_initialized:
+        try:
+            # Try a register read
+            dev._read_register(0x00)
+            health['checks']['sensor'] = 'ok'
+        except:
+            health['checks']['sensor'] = 'error'
             health['status'] = 'degraded'
+    else:
+        health['checks']['sensor'] = 'not_initialized'
+        health['status'] = 'degraded'
 
     # Check thread
-    with MONITORING_STATE['lock']:
-        thread = MONITORING_STATE.get('thread')
-        if thread and thread.is_alive():
-            health['checks']['monitoring_thread'] = 'running'
-        else:
-            health['checks']['monitoring_thread'] = 'stopped'
-            if get_config_boolean('SENSOR', 'auto_start', True):
-                health['status'] = 'degraded'
+    if thread and thread.is_alive():
+        health['checks']['monitoring_thread'] = 'running'
+    else:
+        health['checks']['monitoring_thread'] = 'stopped'
+        if get_config_boolean('SENSOR', 'auto_start', True):
+            health['status'] = 'degraded'
 
     # Check gpiozero button
-    if sensor and sensor.irq_button:
+    if dev and dev.irq_button:
         try:
-            _ = sensor.irq_button.is_pressed
+            _ = dev.irq_button.is_pressed
             health['checks']['gpio_button'] = 'ok'
         except:
             health['checks']['gpio_button'] = 'error'
@@ -2073,81 +2794,92 @@ def health_check():
         health['checks']['gpio_button'] = 'not_initialized'
 
     # Check configuration
-    health['checks']['config'] = 'valid' if validate_config() else 'invalid'
+    health['checks']['config'] = 'valid' if RUNTIME_CFG.config_valid else 'invalid'
     if health['checks']['config'] == 'invalid':
         health['status'] = 'degraded'
 
     # Check sensor health from status
-    with MONITORING_STATE['lock']:
-        if not MONITORING_STATE['status'].get('sensor_healthy', True):
-            health['checks']['sensor_health'] = 'unhealthy'
-            health['status'] = 'degraded'
-        else:
-            health['checks']['sensor_health'] = 'healthy'
-
-    return jsonify(health), 200 if health['status'] == 'healthy' else 503
-
-@app.route('/metrics')
-def metrics():
-    """Prometheus-compatible metrics endpoint for external monitoring"""
-    with MONITORING_STATE['lock']:
-        event_count = len(MONITORING_STATE['events'])
-        sensor_active = 1 if MONITORING_STATE['status']['sensor_active'] else 0
-        sensor_healthy = 1 if MONITORING_STATE['status']['sensor_healthy'] else 0
-        noise_level = {'Normal': 0, 'High': 1, 'Critical': 2}.get(
-            MONITORING_STATE['status']['noise_mode'], 0
-        )
-        interrupt_storm = 1 if MONITORING_STATE['interrupt_storm_detected'] else 0
-        use_imperial = 1 if MONITORING_STATE['status'].get('use_imperial', True) else 0
-
-    with ALERT_STATE["timer_lock"]:
-        warning_active = 1 if ALERT_STATE["warning_active"] else 0
-        critical_active = 1 if ALERT_STATE["critical_active"] else 0
-        active_timer_count = len([t for t in ALERT_STATE["active_timers"] if t.is_alive()])
+    if not status.get('sensor_healthy', True):
+        health['checks']['sensor_health'] = 'unhealthy'
+        health['status'] = 'degraded'
+    else:
+        health['checks']['sensor_health'] = 'healthy'
 
-    gpio_backend_metric = 1 if GPIO_BACKEND == "pigpio" else 0
+    return health
 
-    metrics_text = f"""# HELP lightning_detector_events_total Total lightning events detected
+# Static Prometheus exposition text; only the %d values change per scrape
+METRICS_TEMPLATE = b"""# HELP lightning_detector_events_total Total lightning events detected
 # TYPE lightning_detector_events_total counter
-lightning_detector_events_total {event_count}
+lightning_detector_events_total %d
 
 # HELP lightning_detector_sensor_active Sensor monitoring status (1=active, 0=inactive)
 # TYPE lightning_detector_sensor_active gauge
-lightning_detector_sensor_active {sensor_active}
+lightning_detector_sensor_active %d
 
 # HELP lightning_detector_sensor_healthy Sensor health status (1=healthy, 0=unhealthy)
 # TYPE lightning_detector_sensor_healthy gauge
-lightning_detector_sensor_healthy {sensor_healthy}
+lightning_detector_sensor_healthy %d
 
 # HELP lightning_detector_noise_level Current noise mitigation level (0=Normal, 1=High, 2=Critical)
 # TYPE lightning_detector_noise_level gauge
-lightning_detector_noise_level {noise_level}
+lightning_detector_noise_level %d
 
 # HELP lightning_detector_warning_active Warning alert active (1=active, 0=inactive)
 # TYPE lightning_detector_warning_active gauge
-lightning_detector_warning_active {warning_active}
+lightning_detector_warning_active %d
 
 # HELP lightning_detector_critical_active Critical alert active (1=active, 0=inactive)
 # TYPE lightning_detector_critical_active gauge
-lightning_detector_critical_active {critical_active}
+lightning_detector_critical_active %d
 
 # HELP lightning_detector_interrupt_storm Interrupt storm detected (1=yes, 0=no)
 # TYPE lightning_detector_interrupt_storm gauge
-lightning_detector_interrupt_storm {interrupt_storm}
+lightning_detector_interrupt_storm %d
+
+# HELP lightning_detector_irq_edges_total Sensor IRQ edges received
+# TYPE lightning_detector_irq_edges_total counter
+lightning_detector_irq_edges_total %d
 
 # HELP lightning_detector_active_timers Number of active alert timers
 # TYPE lightning_detector_active_timers gauge
-lightning_detector_active_timers {active_timer_count}
+lightning_detector_active_timers %d
 
 # HELP lightning_detector_gpio_backend GPIO backend in use (1=pigpio, 0=default)
 # TYPE lightning_detector_gpio_backend gauge
-lightning_detector_gpio_backend {gpio_backend_metric}
+lightning_detector_gpio_backend %d
 
 # HELP lightning_detector_use_imperial Units display (1=imperial/miles, 0=metric/km)
 # TYPE lightning_detector_use_imperial gauge
-lightning_detector_use_imperial {use_imperial}
+lightning_detector_use_imperial %d
 """
-    return Response(metrics_text, mimetype='text/plain')
+METRICS_CONTENT_TYPE = 'text/plain; version=0.0.4; charset=utf-8'
+NOISE_LEVELS = {'Normal': 0, 'High': 1, 'Critical': 2}
+
+@app.route('/metrics')
+def metrics():
+    """Prometheus-compatible metrics endpoint for external monitoring"""
+    # One consistent copy-on-write status snapshot, read without the lock
+    status = MONITORING_STATE['status']
+    event_count = len(MONITORING_STATE['events'])
+    sensor_active = 1 if status['sensor_active'] else 0
+    sensor_healthy = 1 if status['sensor_healthy'] else 0
+    noise_level = NOISE_LEVELS.get(status['noise_mode'], 0)
+    interrupt_storm = 1 if MONITORING_STATE['interrupt_storm_detected'] else 0
+    use_imperial = 1 if status.get('use_imperial', True) else 0
+    irq_total = IRQ_STATS[0]
+
+    # Alert flags are independent gauges, read without ALERT_STATE's lock
+    warning_active = 1 if ALERT_STATE["warning_active"] else 0
+    critical_active = 1 if ALERT_STATE["critical_active"] else 0
+    active_timer_count = ALERT_SCHEDULER.pending()
+
+    gpio_backend_metric = 1 if GPIO_BACKEND == "pigpio" else 0
+
+    return Response(METRICS_TEMPLATE % (
+        event_count, sensor_active, sensor_healthy, noise_level, warning_active,
+        critical_active, interrupt_storm, irq_total, active_timer_count,
+        gpio_backend_metric, use_imperial
+    ), content_type=METRICS_CONTENT_TYPE)
 
 @app.route('/config')
 def config_page():
@@ -2178,6 +2910,9 @@ def config_page():
 def save_config_route():
     """Save configuration from web form"""
     try:
+        # Snapshot current values so an unchanged form skips the file rewrite
+        before = {section: dict(CONFIG.items(section)) for section in CONFIG.sections()}
+
         # Define all sections and their checkbox options
         checkbox_options = {
             'SYSTEM': ['debug'],
@@ -2187,33 +2922,44 @@ def save_config_route():
             'DISPLAY': ['use_imperial_units']
         }
 
-        # First, set all known checkbox options to 'false'
-        for section, options in checkbox_options.items():
-            if not CONFIG.has_section(section):
-                CONFIG.add_section(section)
-            for option in options:
-                CONFIG.set(section, option, 'false')
-
-        # Now, update all values from the submitted form
+        # Group submitted fields (named SECTION_option) by section
+        items_by_section = {}
         for key, value in request.form.items():
             if '_' in key:
                 section, option = key.split('_', 1)
-                if not CONFIG.has_section(section):
-                    CONFIG.add_section(section)
-
-                # If the value is 'true' it's a checkbox, otherwise it's a text input
+                items_by_section.setdefault(section, []).append((option, value))
+
+        # Unchecked checkboxes are not submitted, so known checkbox options
+        # default to 'false'; then apply the submitted values section by section.
+        # Visit sections in a fixed order (checkbox sections, then any others
+        # as submitted) so missing sections are added to config.ini in the
+        # same order on every run.
+        for section in dict.fromkeys([*checkbox_options, *items_by_section]):
+            if not CONFIG.has_section(section):
+                CONFIG.add_section(section)
+            for option in checkbox_options.get(section, ()):
+                CONFIG.set(section, option, 'false')
+            # If the value is 'true' it's a checkbox, otherwise it's a text input
+            for option, value in items_by_section.get(section, ()):
                 CONFIG.set(section, option, value)
 
-        # Save to file
-        with open('config.ini', 'w') as configfile:
-            CONFIG.write(configfile)
+        after = {section: dict(CONFIG.items(section)) for section in CONFIG.sections()}
+        if after == before:
+            flash('No configuration changes to save', 'info')
+            return redirect(url_for('config_page'))
+
+        # Rebuild the hot-path config snapshot
+        refresh_runtime_config()
 
         # Update the global status with new unit preference
-        with MONITORING_STATE['lock']:
-            MONITORING_STATE['status']['use_imperial'] = get_distance_unit()
+        update_status(use_imperial=get_distance_unit())
 
-        flash('Configuration saved successfully! A restart may be needed to apply all changes.', 'success')
-        app.logger.info("Configuration updated via web interface")
+        # Save to file (atomic write on the config writer thread)
+        if save_config_async():
+            flash('Configuration saved successfully! A restart may be needed to apply all changes.', 'success')
+            app.logger.info("Configuration updated via web interface")
+        else:
+            flash('Configuration applied but could not be written to disk', 'error')
 
     except Exception as e:
         flash(f'Error saving configuration: {str(e)}', 'error')
@@ -2245,8 +2991,9 @@ def stop_monitoring_route():
         if not MONITORING_STATE.get('thread') or not MONITORING_STATE['thread'].is_alive():
             flash('Monitoring is not running', 'warning')
         else:
-            # Signal thread to stop
+            # Signal thread to stop and wake it if it is waiting for an IRQ
             MONITORING_STATE['stop_event'].set()
+            MONITORING_STATE['irq_event'].set()
             flash('Monitoring stop requested. Please wait...', 'info')
             app.logger.info("Monitoring stop requested via web interface (gpiozero)")
 
@@ -2282,10 +3029,12 @@ def test_alerts():
     with ALERT_STATE["timer_lock"]:
         if alert_level == AlertLevel.CRITICAL:
             ALERT_STATE["critical_active"] = True
-            ALERT_STATE["last_critical_strike"] = datetime.now()
+            ALERT_STATE["last_critical_strike"] = time.time()
+            ALERT_STATE["last_critical_strike_mono"] = time.monotonic()
         else:
             ALERT_STATE["warning_active"] = True
-            ALERT_STATE["last_warning_strike"] = datetime.now()
+            ALERT_STATE["last_warning_strike"] = time.time()
+            ALERT_STATE["last_warning_strike_mono"] = time.monotonic()
 
     flash(f'Test {alert_type} alert sent (gpiozero backend: {GPIO_BACKEND})', 'success')
     return redirect(url_for('index'))
@@ -2301,6 +3050,8 @@ def reset_alerts():
         ALERT_STATE["critical_active"] = False
         ALERT_STATE["last_warning_strike"] = None
         ALERT_STATE["last_critical_strike"] = None
+        ALERT_STATE["last_warning_strike_mono"] = None
+        ALERT_STATE["last_critical_strike_mono"] = None
 
     flash('All alerts have been reset', 'success')
     app.logger.info("Alerts reset via web interface (gpiozero)")
@@ -2310,48 +3061,66 @@ def reset_alerts():
 @app.route('/test_slack')
 def test_slack():
     """Test Slack integration"""
-    if not get_config_boolean('SLACK', 'enabled', False):
+    if not RUNTIME_CFG.slack_enabled:
         flash('Slack notifications are disabled', 'warning')
         return redirect(url_for('config_page'))
 
+    if not RUNTIME_CFG.slack_configured:
+        flash('Slack is enabled, but no Bot Token is configured', 'error')
+        return redirect(url_for('config_page'))
+
     use_imperial = get_distance_unit()
     units = "Imperial (miles)" if use_imperial else "Metric (km)"
-    send_slack_notification(
+    queued = send_slack_notification(
         f"🧪 Test message from Lightning Detector v2.1 (gpiozero backend: {GPIO_BACKEND}, units: {units})",
         alert_level=AlertLevel.WARNING
     )
 
-    flash('Test message sent to Slack. Check your Slack channel.', 'info')
+    if queued:
+        flash('Test message sent to Slack. Check your Slack channel.', 'info')
+    else:
+        flash('Test message not sent: suppressed as a duplicate of one sent less than '
+              f'{SLACK_DEDUP_WINDOW:.0f} seconds ago (or the Slack queue is full)', 'warning')
     return redirect(url_for('config_page'))
 
 @app.route('/check_sensor')
 def check_sensor():
-    """Check and fix sensor configuration"""
-    if not sensor:
+    """
+    Check and fix sensor configuration
+
+    A successful response is reused for CHECK_SENSOR_TTL seconds so a
+    polling client can't keep the SPI bus busy with register bursts.
+    """
+    global CHECK_SENSOR_RESPONSE
+
+    dev = sensor  # Bind once: the global can be swapped by a re-init
+    if not dev:
         return jsonify({"error": "Sensor not initialized"}), 500
 
+    checked_at, body = CHECK_SENSOR_RESPONSE
+    if time.monotonic() - checked_at < CHECK_SENSOR_TTL:
+        return Response(body, mimetype='application/json')
+
     results = {"timestamp": datetime.now().isoformat()}
 
     try:
-        # Read all important registers
-        regs = {}
-        for addr in [0x00, 0x01, 0x02, 0x03, 0x07]:
-            val = sensor._read_register(addr)
-            regs[f"0x{addr:02X}"] = f"0x{val:02X}"
+        # Read all important registers (one burst covering 0x00-0x07)
+        vals = dev._read_registers(0x00, 8)
+        regs = {f"0x{addr:02X}": f"0x{vals[addr]:02X}" for addr in (0x00, 0x01, 0x02, 0x03, 0x07)}
 
         # Check and fix MASK_DIST if needed
-        reg03 = sensor._read_register(0x03)
-        mask_dist = (reg03 >> 5) & 0x01
+        reg03 = vals[0x03]
+        mask_dist = reg03 & dev.MASK_DIST_BIT
 
         if mask_dist:
             # Fix it!
             app.logger.warning("MASK_DIST was set - fixing now!")
-            new_reg03 = reg03 & ~(1 << 5)
-            sensor._write_register(0x03, new_reg03)
+            new_reg03 = reg03 & ~dev.MASK_DIST_BIT
+            dev._write_register(0x03, new_reg03)
             time.sleep(0.002)
 
             # Verify fix
-            reg03_after = sensor._read_register(0x03)
+            reg03_after = dev._read_register(0x03)
             results["mask_dist_fixed"] = True
             results["reg03_before"] = f"0x{reg03:02X}"
             results["reg03_after"] = f"0x{reg03_after:02X}"
@@ -2359,15 +3128,15 @@ def check_sensor():
             results["mask_dist_fixed"] = False
             results["mask_dist_ok"] = True
 
-        # Clear any pending interrupts
-        for _ in range(5):
-            _ = sensor._read_register(0x03)
-            time.sleep(0.001)
+        # Clear any pending interrupt
+        dev.clear_interrupts()
 
         results["registers"] = regs
         results["status"] = "Sensor checked and fixed if needed"
 
-        return jsonify(results)
+        body = json_dumps_bytes(results)
+        CHECK_SENSOR_RESPONSE = (time.monotonic(), body)
+        return Response(body, mimetype='application/json')
 
     except Exception as e:
         return jsonify({"error": str(e)}), 500
@@ -2378,7 +3147,8 @@ def force_recalibrate():
     Perform an aggressive reset and recalibration of the sensor.
     This is useful for clearing persistent noise flags (INT_NH).
     """
-    if not sensor:
+    dev = sensor  # Bind once: the global can be swapped by a re-init
+    if not dev:
         return jsonify({"error": "Sensor not initialized"}), 500
 
     app.logger.warning("=== FORCING SENSOR RECALIBRATION ===")
@@ -2387,33 +3157,33 @@ def force_recalibrate():
     try:
         with SENSOR_INIT_LOCK:
             # Step 1: Force a direct reset command
-            sensor._write_register(0x3C, 0x96)
+            dev._write_register(dev.REG_PRESET, dev.DIRECT_COMMAND)
             time.sleep(0.005)
             results["steps"].append("Sent direct reset command (0x3C = 0x96)")
 
             # Step 2: Temporarily set to a less sensitive indoor setting
             # AFE_GB=01110 (Outdoor setting)
-            sensor._write_register(0x00, 0b00011100)
+            dev._write_register(0x00, dev.AFE_OUTDOOR)
             time.sleep(0.002)
             results["steps"].append("Set AFE gain to outdoor mode temporarily")
 
             # Step 3: Set noise floor to a high level to force it to settle
-            sensor._write_register(0x01, (0x07 << 4) | 0x0F) # Max noise floor, max watchdog
+            dev._write_register(0x01, dev.NF_WDTH_MAX)
             time.sleep(0.002)
             results["steps"].append("Set noise floor to maximum temporarily")
 
-            # Step 4: Aggressively clear any pending interrupts
-            for i in range(10):
-                _ = sensor._read_register(0x03)
-                time.sleep(0.002)
-            results["steps"].append("Aggressively cleared interrupt register 10 times")
+            # Step 4: Let the raised noise floor settle, then clear the latch
+            # once (power_up() below resets and runs its own clearing loop)
+            time.sleep(0.020)
+            dev.clear_interrupts()
+            results["steps"].append("Cleared interrupt register after 20 ms settle")
 
             # Step 5: Restore the high-sensitivity indoor settings from power_up()
-            sensor.power_up()
+            dev.power_up()
             results["steps"].append("Restored original high-sensitivity indoor settings via power_up()")
 
             # Step 6: Final check of the interrupt register
-            final_int = sensor._read_register(0x03) & 0x0F
+            final_int = dev._read_register(0x03) & 0x0F
             results["final_interrupt_value"] = f"0x{final_int:02X}"
             if final_int == 0x00:
                 results["status"] = "SUCCESS: Sensor recalibrated and idle."
@@ -2422,7 +3192,7 @@ def force_recalibrate():
                 results["status"] = "FAILURE: Sensor still has a pending interrupt."
                 app.logger.error(f"Force recalibration failed. INT is still 0x{final_int:02X}.")
 
-        return jsonify(results)
+        return Response(json_dumps_bytes(results), mimetype='application/json')
 
     except Exception as e:
         app.logger.error(f"Error during force recalibration: {e}", exc_info=True)
@@ -2441,12 +3211,15 @@ def load_config():
             CONFIG.add_section('DISPLAY')
             CONFIG.set('DISPLAY', 'use_imperial_units', 'true')
             # Save updated config
-            with open(config_file, 'w') as configfile:
-                CONFIG.write(configfile)
+            buffer = io.StringIO()
+            CONFIG.write(buffer)
+            write_config_file(buffer.getvalue(), config_file)
             app.logger.info("Added DISPLAY section to config with imperial units as default")
 
-        # Validate configuration
-        if not validate_config():
+        # Pre-parse hot-path settings (also validates the configuration)
+        refresh_runtime_config()
+
+        if not RUNTIME_CFG.config_valid:
             app.logger.warning("Configuration validation failed - check logs for details")
     else:
         app.logger.error(f"Configuration file {config_file} not found!")
@@ -2464,8 +3237,8 @@ def initialize_logging():
         datefmt='%Y-%m-%d %H:%M:%S'
     )
 
-    # File handler with rotation
-    file_handler = RotatingFileHandler(
+    # File handler with rotation (flushed once per burst, see BatchFlushQueueListener)
+    file_handler = BufferedRotatingFileHandler(
         'lightning_detector.log',
         maxBytes=max_size,
         backupCount=backup_count
@@ -2476,10 +3249,16 @@ def initialize_logging():
     console_handler = logging.StreamHandler()
     console_handler.setFormatter(formatter)
 
+    # Log calls only enqueue the record; file and console writes happen on
+    # the listener thread so SD card stalls never block the monitoring thread
+    global LOG_LISTENER
+    log_queue = SimpleQueue()
+    LOG_LISTENER = BatchFlushQueueListener(log_queue, file_handler, console_handler, respect_handler_level=True)
+    LOG_LISTENER.start()
+
     # Configure Flask logger
     app.logger.setLevel(getattr(logging, log_level))
-    app.logger.addHandler(file_handler)
-    app.logger.addHandler(console_handler)
+    app.logger.addHandler(QueueHandler(log_queue))
 
     # Add rate limiting filter
     rate_filter = RateLimitFilter()
@@ -2492,16 +3271,25 @@ def initialize_logging():
 
 def cleanup_resources():
     """Cleanup function called on application shutdown"""
+    global LOG_LISTENER
+
+    if SHUTDOWN_EVENT.is_set():
+        return  # Already cleaned up (called from __main__ and atexit)
+    SHUTDOWN_EVENT.set()
+
     app.logger.info(f"Starting application cleanup (gpiozero backend: {GPIO_BACKEND})...")
 
     # Stop monitoring
     with MONITORING_STATE['lock']:
         MONITORING_STATE['stop_event'].set()
+        MONITORING_STATE['irq_event'].set()
 
     # Stop Slack worker
     if SLACK_WORKER_THREAD and SLACK_WORKER_THREAD.is_alive():
-        SLACK_QUEUE.put(None)  # Shutdown signal
+        SLACK_STOP.set()  # Shutdown signal
+        SLACK_EVENT.set()
         SLACK_WORKER_THREAD.join(timeout=5)
+    SLACK_SESSION.close()
 
     # Wait for monitoring thread to stop
     with MONITORING_STATE['lock']:
@@ -2515,8 +3303,13 @@ def cleanup_resources():
         if watchdog and watchdog.is_alive():
             watchdog.join(timeout=5)
 
-    # Clean up alert timers
+    # Clean up alert timers, then anything else queued on the scheduler
+    # (noise floor reverts)
     cleanup_alert_timers()
+    ALERT_SCHEDULER.cancel_all()
+
+    # Finish any pending config.ini write
+    CONFIG_WRITER.shutdown(wait=True)
 
     # Clean up sensor (gpiozero cleanup)
     global sensor
@@ -2528,44 +3321,72 @@ def cleanup_resources():
 
     app.logger.info(f"Application cleanup complete (gpiozero backend: {GPIO_BACKEND})")
 
+    # Flush queued log records last
+    if LOG_LISTENER:
+        LOG_LISTENER.stop()
+        LOG_LISTENER = None
+
 # Register cleanup function
 atexit.register(cleanup_resources)
 
 # --- Interrupt Handler (defined before starting monitoring) ---
-def handle_sensor_interrupt(channel):
+def on_sensor_irq(channel):
+    """
+    GPIO edge callback (runs on the gpiozero callback thread)
+
+    Only counts the edge and signals the monitoring thread; all SPI work
+    happens there so the callback thread is released immediately.
+    """
+    IRQ_STATS[0] += 1  # Single writer: no lock needed
+    IRQ_STATS[1] = time.monotonic_ns()
+    MONITORING_STATE['irq_event'].set()
+
+def handle_sensor_interrupt():
     """
-    GPIO interrupt callback (gpiozero adaptation):
+    Sensor interrupt handler (runs on the monitoring thread):
     Determines interrupt source, dispatches handlers, and clears the interrupt.
     """
+    now = time.time()  # Single timestamp for this interrupt
+    dev = sensor  # Bind once: local lookups, and a re-init can't swap it mid-handler
+    if dev is None:
+        return
+
     try:
+        # INT is only valid 2 ms after IRQ goes high (datasheet); wake-up
+        # latency usually covers part of that, so only sleep the remainder
+        remaining_ns = IRQ_SETTLE_NS - (time.monotonic_ns() - IRQ_STATS[1])
+        if remaining_ns > 0:
+            time.sleep(remaining_ns / 1e9)
+
         # 1. Read the reason for the interrupt
-        reason = sensor.get_interrupt_reason()
+        #    (with distance and energy in the same SPI burst)
+        reason, distance_km, energy = dev.get_interrupt_data()
 
         # 2. Dispatch the appropriate handler
         if reason & AS3935LightningDetector.INT_L:
-            handle_lightning_event()
+            handle_lightning_event(now, distance_km, energy)
         elif reason & AS3935LightningDetector.INT_D:
             handle_disturber_event()
         elif reason & AS3935LightningDetector.INT_NH:
-            handle_noise_high_event()
+            handle_noise_high_event(now, distance_km, energy)
         else:
             # This can happen if the interrupt clears before we read it
-            app.logger.debug(f"Spurious interrupt or already cleared. Reason: 0x{reason:02X}")
+            app.logger.debug("Spurious interrupt or already cleared. Reason: 0x%02X", reason)
 
-        # 3. Update status
-        with MONITORING_STATE['lock']:
-            MONITORING_STATE['status']['last_reading'] = datetime.now().isoformat()
+        # 3. Record the reading time (single writer, no lock or status copy)
+        LAST_READING[0] = now
+
+        # INT, energy and distance registers changed
+        invalidate_check_sensor()
 
     except Exception as e:
         app.logger.error(f"Interrupt handler error: {e}", exc_info=True)
 
     finally:
-        # 4. CRITICAL FIX: Ensure the interrupt is cleared by reading the register again.
-        # This allows the IRQ pin to return to its idle state for the next event.
-        # A small delay is added as per best practices for this sensor.
-        time.sleep(0.002) # 2ms delay
-        if sensor:
-            _ = sensor.get_interrupt_reason()
+        # 4. If the IRQ line is still asserted, clear the interrupt by reading
+        # the register again so the pin returns to idle for the next event
+        if _gpio_available(dev) and dev.irq_button.is_pressed:
+            _ = dev.get_interrupt_reason()
 
 # --- Main Application Entry Point ---
 if __name__ == '__main__':
@@ -2605,6 +3426,12 @@ if __name__ == '__main__':
         # Determine host and port
         debug_mode = get_config_boolean('SYSTEM', 'debug', False)
         host = '0.0.0.0'  # Listen on all interfaces
+
+        # Only reload templates while debugging. The Jinja environment already
+        # exists (template filters are registered at import), so set it there
+        # too; otherwise every render would stat the template file.
+        app.config['TEMPLATES_AUTO_RELOAD'] = debug_mode
+        app.jinja_env.auto_reload = debug_mode
         port = 5000
 
         # Display units being used
@@ -2612,10 +3439,16 @@ if __name__ == '__main__':
         units_msg = "Using IMPERIAL units (miles)" if use_imperial else "Using METRIC units (km)"
         app.logger.info(units_msg)
 
-        app.logger.info(f"Starting web server on {host}:{port} (debug={debug_mode}, gpio_backend={GPIO_BACKEND})")
+        # Use waitress unless debugging (the Werkzeug debugger needs the dev server).
+        # Threads (not processes) keep MONITORING_STATE and the sensor shared.
+        server = WSGI_SERVER if not debug_mode else "werkzeug"
+        app.logger.info(f"Starting web server on {host}:{port} (server={server}, debug={debug_mode}, gpio_backend={GPIO_BACKEND})")
 
         # Run Flask app
-        app.run(host=host, port=port, debug=debug_mode, threaded=True)
+        if server == "waitress":
+            waitress_serve(app, host=host, port=port, threads=8)
+        else:
+            app.run(host=host, port=port, debug=debug_mode, threaded=True)
 
     except KeyboardInterrupt:
         app.logger.info("Keyboard interrupt received")
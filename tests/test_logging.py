@@ -0,0 +1,69 @@
+"""Tests for the buffered log file handler"""
+import logging
+import os
+import tempfile
+import unittest
+
+try:
+    import lightning
+except ImportError as e:  # Flask/spidev/gpiozero are only present on the Pi image
+    raise unittest.SkipTest(f"lightning dependencies not installed: {e}")
+
+
+class BufferedRotatingFileHandlerTest(unittest.TestCase):
+    def setUp(self):
+        self.tmpdir = tempfile.TemporaryDirectory()
+        self.path = os.path.join(self.tmpdir.name, 'test.log')
+        self.logger = logging.getLogger(f"{__name__}.{self.id()}")
+        self.logger.propagate = False
+        self.logger.setLevel(logging.INFO)
+
+    def tearDown(self):
+        for handler in list(self.logger.handlers):
+            self.logger.removeHandler(handler)
+            handler.close()
+        self.tmpdir.cleanup()
+
+    def _handler(self, max_bytes, backup_count=2):
+        handler = lightning.BufferedRotatingFileHandler(
+            self.path, maxBytes=max_bytes, backupCount=backup_count)
+        handler.setFormatter(logging.Formatter('%(message)s'))
+        self.logger.addHandler(handler)
+        return handler
+
+    def test_records_held_until_flush_buffer_with_size_limit(self):
+        handler = self._handler(max_bytes=10 * 1024 * 1024)
+
+        for i in range(5):
+            self.logger.info("record %d", i)
+        self.assertEqual(os.path.getsize(self.path), 0)
+
+        handler.flush_buffer()
+        with open(self.path) as f:
+            self.assertEqual(f.read().splitlines(), [f"record {i}" for i in range(5)])
+
+    def test_rolls_over_at_size_limit(self):
+        handler = self._handler(max_bytes=50)
+
+        # 16 characters per line: three fit below 50, the fourth rolls over
+        for i in range(10):
+            self.logger.info("record number %d", i)
+        handler.flush_buffer()
+
+        sizes = [os.path.getsize(self.path + suffix) for suffix in ('', '.1', '.2')]
+        self.assertEqual(sizes, [16, 48, 48])
+
+    def test_size_includes_existing_file(self):
+        with open(self.path, 'w') as f:
+            f.write('x' * 40)
+        handler = self._handler(max_bytes=50)
+
+        self.logger.info("record number 0")  # 40 + 16 >= 50
+        handler.flush_buffer()
+
+        self.assertEqual(os.path.getsize(self.path + '.1'), 40)
+        self.assertEqual(os.path.getsize(self.path), 16)
+
+
+if __name__ == '__main__':
+    unittest.main()